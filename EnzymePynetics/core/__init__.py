@@ -17,6 +17,11 @@ from .replicate import Replicate
 from .paramtype import ParamType
 from .sboterm import SBOTerm
 from .datatypes import DataTypes
+from .solver import SolverSettings
+from .multistart import MultiStartSettings
+from .tournament import TournamentSettings
+from .fitcache import FitCache
+from .resolution import ResolutionSchedule
 
 __doc__ = ""
 __all__ = [
@@ -39,4 +44,9 @@ __all__ = [
     "ParamType",
     "SBOTerm",
     "DataTypes",
+    "SolverSettings",
+    "MultiStartSettings",
+    "TournamentSettings",
+    "FitCache",
+    "ResolutionSchedule",
 ]
@@ -0,0 +1,294 @@
+import warnings
+import numpy as np
+import sympy as sp
+
+from typing import List, Optional, Tuple, Union
+from lmfit import Parameters
+from scipy.special import wrightomega
+from .kineticmodel import KineticModel
+from .jaxbackend import JaxModel
+from .numbabackend import compile_rate_laws, numba_available
+from .paramtype import ParamType
+from .solver import SolverSettings
+
+SPECIES = ("substrate", "catalyst", "product")
+
+
+class CompiledModel:
+    """Numerical representation of the rate laws of a reaction system.
+
+    Rate laws are parsed and lambdified once upon construction. The resulting
+    object is cached by the `ReactionSystem` and reused for every integration
+    until the equations or the parameter set of the system change.
+
+    The right-hand side uses a positional calling convention: species are passed
+    as a vector ordered like `SPECIES` and parameters as a flat float vector
+    ordered like `parameters`. Use `parameter_vector` to resolve an lmfit
+    `Parameters` object or a dict once before integration. Several replicates
+    can be integrated as one system by concatenating their species vectors, the
+    rate laws are then evaluated vectorized over all replicates.
+
+    The Jacobian of the rate laws with respect to the species is derived
+    symbolically and compiled alongside the right-hand side. Since replicates do
+    not interact, the Jacobian of a stacked system is block diagonal and is
+    provided in the banded storage format of LSODA.
+
+    For gradient-based fitting, the forward sensitivity system dS/dt = J S + df/dp
+    is integrated together with the species, yielding the derivatives of all
+    species with respect to the parameters along the trajectory.
+
+    For the 'jax' solver backend, the rate laws are additionally lambdified to
+    JAX on first use. See `jax_model`.
+    """
+
+    def __init__(
+        self,
+        signature: Tuple,
+        parameters: List[str],
+        substrate_model: KineticModel,
+        enzyme_model: Optional[KineticModel] = None,
+        compiler: str = "numpy",
+    ):
+        self.signature = signature
+        self.parameters = tuple(parameters)
+
+        self.species_symbols = [sp.Symbol(name) for name in SPECIES]
+        self.param_symbols = [sp.Symbol(name) for name in self.parameters]
+
+        d_substrate = substrate_model._sp_rate_law
+        d_enzyme = enzyme_model._sp_rate_law if enzyme_model else sp.Integer(0)
+        self.rate_laws = [d_substrate, d_enzyme, -d_substrate]
+
+        self._check_symbols()
+
+        self.closed_form = enzyme_model is None and self._is_michaelis_menten(
+            d_substrate
+        )
+
+        self._rhs = sp.lambdify(
+            [self.species_symbols, self.param_symbols], self.rate_laws, "numpy"
+        )
+
+        jacobian = sp.Matrix(self.rate_laws).jacobian(self.species_symbols)
+        self.jacobian_entries = [
+            (row, col)
+            for row in range(len(SPECIES))
+            for col in range(len(SPECIES))
+            if jacobian[row, col] != 0
+        ]
+        self._jac = sp.lambdify(
+            [self.species_symbols, self.param_symbols],
+            [jacobian[row, col] for row, col in self.jacobian_entries],
+            "numpy",
+        )
+
+        param_jacobian = sp.Matrix(self.rate_laws).jacobian(self.param_symbols)
+        self.param_jacobian_entries = [
+            (row, col)
+            for row in range(len(SPECIES))
+            for col in range(len(self.parameters))
+            if param_jacobian[row, col] != 0
+        ]
+        self._param_jac = sp.lambdify(
+            [self.species_symbols, self.param_symbols],
+            [param_jacobian[row, col] for row, col in self.param_jacobian_entries],
+            "numpy",
+        )
+
+        self.compiler = compiler
+        if compiler == "numba":
+            self._compile_numba(jacobian)
+
+        self._jax_models = {}
+
+    def _check_symbols(self):
+        known = set(self.species_symbols) | set(self.param_symbols)
+        for rate_law in self.rate_laws:
+            unknowns = rate_law.free_symbols - known
+            if unknowns:
+                raise ValueError(
+                    f"Rate law '{rate_law}' contains symbols {sorted(map(str, unknowns))}"
+                    f" which are neither species {SPECIES} nor parameters"
+                    f" {list(self.parameters)} of the reaction system."
+                )
+
+    def _compile_numba(self, jacobian: sp.Matrix):
+        if not numba_available():
+            warnings.warn(
+                "Numba is not installed, falling back to NumPy rate laws.",
+                RuntimeWarning,
+            )
+            self.compiler = "numpy"
+            return
+
+        module = compile_rate_laws(
+            rate_laws=self.rate_laws,
+            jacobian=[
+                (row, col, jacobian[row, col]) for row, col in self.jacobian_entries
+            ],
+            species_symbols=self.species_symbols,
+            param_symbols=self.param_symbols,
+        )
+        self.ode_model = module.ode_model
+        self.ode_jacobian = module.ode_jacobian
+
+    def jax_model(self, settings: SolverSettings) -> JaxModel:
+        """JAX model of the rate laws, which is compiled once per set of solver
+        tolerances."""
+        key = (settings.rtol, settings.atol, settings.max_steps)
+
+        if key not in self._jax_models:
+            self._jax_models[key] = JaxModel(
+                rate_laws=self.rate_laws,
+                species_symbols=self.species_symbols,
+                param_symbols=self.param_symbols,
+                rtol=settings.rtol,
+                atol=settings.atol,
+                max_steps=settings.max_steps,
+            )
+
+        return self._jax_models[key]
+
+    def _is_michaelis_menten(self, rate_law: sp.Expr) -> bool:
+        k_cat = sp.Symbol(ParamType.K_CAT.value)
+        K_M = sp.Symbol(ParamType.K_M.value)
+
+        if not {k_cat, K_M} <= set(self.param_symbols):
+            return False
+
+        substrate, catalyst, _ = self.species_symbols
+        michaelis_menten = -k_cat * catalyst * substrate / (K_M + substrate)
+
+        return sp.cancel(rate_law - michaelis_menten) == 0
+
+    def parameter_vector(self, params: Union[Parameters, dict]) -> np.ndarray:
+        """Resolves parameter values to a float vector ordered like `parameters`."""
+        try:
+            params = params.valuesdict()
+        except AttributeError:
+            pass
+
+        return np.array([params[name] for name in self.parameters], dtype=np.float64)
+
+    def ode_model(
+        self, species: np.ndarray, time: np.ndarray, params: np.ndarray
+    ) -> np.ndarray:
+        """Rates of the stacked species. Besides a parameter vector, `params` may be
+        a matrix of shape (parameters, replicates) holding one parameter set per
+        replicate."""
+        states = species.reshape(-1, len(SPECIES))
+        rates = np.empty_like(states)
+
+        for species_id, rate in enumerate(self._rhs(states.T, params)):
+            rates[:, species_id] = rate
+
+        return rates.ravel()
+
+    @property
+    def bandwidth(self) -> int:
+        """Number of sub- and super-diagonals of the Jacobian of a stacked system."""
+        return len(SPECIES) - 1
+
+    def ode_jacobian(
+        self, species: np.ndarray, time: np.ndarray, params: np.ndarray
+    ) -> np.ndarray:
+        """Jacobian of `ode_model` in banded storage, where entry (i - j + bandwidth, j)
+        holds the derivative of the i-th rate with respect to the j-th species."""
+        states = species.reshape(-1, len(SPECIES))
+        banded = np.zeros((2 * self.bandwidth + 1, species.size))
+
+        for (row, col), derivative in zip(
+            self.jacobian_entries, self._jac(states.T, params)
+        ):
+            banded[row - col + self.bandwidth, col :: len(SPECIES)] = derivative
+
+        return banded
+
+    # NumPy implementations, which accept one parameter set per replicate even if
+    # the instance uses compiled rate laws
+    ensemble_model = ode_model
+    ensemble_jacobian = ode_jacobian
+
+    @property
+    def sensitivity_block_size(self) -> int:
+        """Number of states per replicate in the sensitivity system."""
+        return len(SPECIES) * (1 + len(self.parameters))
+
+    def sensitivity_model(
+        self, augmented: np.ndarray, time: np.ndarray, params: np.ndarray
+    ) -> np.ndarray:
+        """Right-hand side of the species and their forward sensitivities. Each
+        replicate holds its species followed by the sensitivity matrix
+        dS/dp of shape (species, parameters) in row-major order."""
+        n_species, n_params = len(SPECIES), len(self.parameters)
+
+        augmented = augmented.reshape(-1, self.sensitivity_block_size)
+        states = augmented[:, :n_species].T
+        sensitivities = augmented[:, n_species:].reshape(-1, n_species, n_params)
+
+        rates = np.empty_like(augmented)
+        for species_id, rate in enumerate(self._rhs(states, params)):
+            rates[:, species_id] = rate
+
+        jacobian = np.zeros((augmented.shape[0], n_species, n_species))
+        for (row, col), derivative in zip(
+            self.jacobian_entries, self._jac(states, params)
+        ):
+            jacobian[:, row, col] = derivative
+
+        param_jacobian = np.zeros((augmented.shape[0], n_species, n_params))
+        for (row, col), derivative in zip(
+            self.param_jacobian_entries, self._param_jac(states, params)
+        ):
+            param_jacobian[:, row, col] = derivative
+
+        rates[:, n_species:] = (jacobian @ sensitivities + param_jacobian).reshape(
+            augmented.shape[0], -1
+        )
+
+        return rates.ravel()
+
+    def integrated_michaelis_menten(
+        self, times: np.ndarray, init_conditions: np.ndarray, params: np.ndarray
+    ) -> np.ndarray:
+        """Closed-form progress curves of irreversible Michaelis-Menten kinetics.
+
+        The integrated rate law S(t) = K_M * W(S0 / K_M * exp((S0 - k_cat * E0 * t)
+        / K_M)) is evaluated through the Wright omega function, which equals the
+        Lambert W function of an exponential without overflowing for large S0 / K_M.
+
+        Args:
+            times (np.ndarray): Time points of each replicate.
+            init_conditions (np.ndarray): Initial substrate, catalyst and product
+                concentrations of each replicate.
+            params (np.ndarray): Parameter vector ordered like `parameters`, or
+                matrix of shape (parameters, replicates).
+
+        Returns:
+            np.ndarray: Species of shape (replicates, time points, species).
+        """
+        k_cat = np.reshape(
+            params[self.parameters.index(ParamType.K_CAT.value)], (-1, 1)
+        )
+        K_M = np.reshape(params[self.parameters.index(ParamType.K_M.value)], (-1, 1))
+
+        substrate_0, catalyst_0, product_0 = np.atleast_2d(init_conditions).T[
+            :, :, None
+        ]
+        elapsed = times - times[:, :1]
+
+        with np.errstate(divide="ignore"):
+            omega_argument = (
+                np.log(substrate_0 / K_M)
+                + (substrate_0 - k_cat * catalyst_0 * elapsed) / K_M
+            )
+        substrate = K_M * wrightomega(omega_argument)
+
+        return np.stack(
+            [
+                substrate,
+                np.broadcast_to(catalyst_0, substrate.shape),
+                product_0 + substrate_0 - substrate,
+            ],
+            axis=-1,
+        )
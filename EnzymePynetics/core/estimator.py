@@ -4,7 +4,8 @@ import sdRDM
 import numpy as np
 import pandas as pd
 import plotly.express as px
-from typing import Optional, Union, List
+from typing import Callable, Optional, Tuple, Union, List
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
 from pydantic import Field, PrivateAttr
 from sdRDM.base.listplus import ListPlus
 from sdRDM.base.utils import forge_signature, IDGenerator
@@ -19,6 +20,13 @@ from .modelresult import ModelResult
 from .abstractspecies import AbstractSpecies
 from .reactionelement import ReactionElement
 from .reactionsystem import ReactionSystem
+from .solver import SolverSettings
+from .multistart import MultiStartSettings
+from .tournament import TournamentSettings
+from .fastcopy import copy_kinetic_model, fast_copy
+from .fitcache import FitCache
+from .ragged import compact_rows, pad_rows
+from .resolution import ResolutionSchedule
 from .kineticparameter import KineticParameter
 from .sboterm import SBOTerm
 from .vessel import Vessel
@@ -86,6 +94,10 @@ class Estimator(sdRDM.DataModel):
     __commit__: Optional[str] = PrivateAttr(
         default="70285185b8d9c7baf61e12dd52d943624695a510"
     )
+    _data_view: Optional[dict] = PrivateAttr(default=None)
+    _data_source: Optional[tuple] = PrivateAttr(default=None)
+    _index: Optional[dict] = PrivateAttr(default=None)
+    _index_key: Optional[tuple] = PrivateAttr(default=None)
 
     def add_to_reaction_systems(
         self,
@@ -163,6 +175,7 @@ class Estimator(sdRDM.DataModel):
         if id is not None:
             params["id"] = id
         self.species.append(Protein(**params))
+        self._index = None
         return self.species[-1]
 
     def add_reactant_to_species(
@@ -213,6 +226,7 @@ class Estimator(sdRDM.DataModel):
         if id is not None:
             params["id"] = id
         self.species.append(Reactant(**params))
+        self._index = None
         return self.species[-1]
 
     def add_to_reactions(
@@ -266,6 +280,7 @@ class Estimator(sdRDM.DataModel):
         if id is not None:
             params["id"] = id
         self.reactions.append(Reaction(**params))
+        self._index = None
         return self.reactions[-1]
 
     def add_to_models(
@@ -339,6 +354,7 @@ class Estimator(sdRDM.DataModel):
         if id is not None:
             params["id"] = id
         self.measurements.append(Measurement(**params))
+        self.invalidate_data()
         return self.measurements[-1]
 
     def add_reaction(
@@ -459,6 +475,7 @@ class Estimator(sdRDM.DataModel):
             params["id"] = id
 
         new_reaction = Reaction(**params)
+        self._index = None
 
         if any([reaction.id == new_reaction.id for reaction in self.reactions]):
             self.reactions = [
@@ -525,8 +542,9 @@ class Estimator(sdRDM.DataModel):
         self.reaction_systems = ListPlus()
         for substrate_model in self.substrate_models:
             # Add different substrate models to reaction
-            substrate_reaction = Reaction(**self.reactions[0].to_dict())
-            substrate_reaction.model = KineticModel(**substrate_model.to_dict())
+            substrate_reaction = fast_copy(
+                self.reactions[0], model=copy_kinetic_model(substrate_model)
+            )
 
             self.reaction_systems.append(
                 ReactionSystem(
@@ -539,9 +557,13 @@ class Estimator(sdRDM.DataModel):
                 inactivation_reaction = self._create_inactivation_reaction()
                 # create reaction system with enzyme models
                 for enzyme_model in self.enzyme_models:
-                    substrate_reaction = Reaction(**substrate_reaction.to_dict())
-                    new_inactivation = Reaction(**inactivation_reaction.to_dict())
-                    new_inactivation.model = KineticModel(**enzyme_model.to_dict())
+                    substrate_reaction = fast_copy(
+                        substrate_reaction,
+                        model=copy_kinetic_model(substrate_reaction.model),
+                    )
+                    new_inactivation = fast_copy(
+                        inactivation_reaction, model=copy_kinetic_model(enzyme_model)
+                    )
 
                     self.reaction_systems.append(
                         ReactionSystem(
@@ -552,45 +574,53 @@ class Estimator(sdRDM.DataModel):
 
     def _create_inactivation_reaction(self) -> Reaction:
         # Make copies of enzyme species
-        if self.enzyme.ontology == SBOTerm.SMALL_MOLECULE.value:
+        enzyme = self.enzyme
+        if enzyme.ontology == SBOTerm.SMALL_MOLECULE.value:
             Species = Reactant
         else:
             Species = Protein
-        active = Species(**self.enzyme.to_dict())
-        active.name += " (active)"
-        active.constant = False
-
-        inactive = Species(**self.enzyme.to_dict())
-        inactive.name += " (inactive)"
-        inactive.id = f"{inactive.id[0]}{int(inactive.id[1:])+1}"
-        inactive.constant = False
+        if not isinstance(enzyme, Species):
+            enzyme = Species(**enzyme.to_dict())
+
+        active = fast_copy(enzyme, name=f"{enzyme.name} (active)", constant=False)
+
+        inactive = fast_copy(
+            enzyme,
+            name=f"{enzyme.name} (inactive)",
+            id=f"{enzyme.id[0]}{int(enzyme.id[1:])+1}",
+            constant=False,
+        )
         self.species.append(inactive)
 
         # Make enzyme inactivation reaction
-        inactivation = Reaction(**self.reactions[0].to_dict())
-        inactivation.name = "enzyme inactivation"
-        inactivation.reversible = False
-        inactivation.educts = [
-            ReactionElement(
-                species_id=active.id,
-                constant=False,
-                ontology=SBOTerm.PROTEIN,
-            )
-        ]
-        inactivation.products = [
-            ReactionElement(
-                species_id=inactive.id,
-                constant=False,
-                ontology=SBOTerm.PROTEIN,  # , since inactive
-            )
-        ]
+        inactivation = fast_copy(
+            self.reactions[0],
+            name="enzyme inactivation",
+            reversible=False,
+            educts=[
+                ReactionElement(
+                    species_id=active.id,
+                    constant=False,
+                    ontology=SBOTerm.PROTEIN,
+                )
+            ],
+            products=[
+                ReactionElement(
+                    species_id=inactive.id,
+                    constant=False,
+                    ontology=SBOTerm.PROTEIN,  # , since inactive
+                )
+            ],
+        )
 
         return inactivation
 
     def _remove_nans(self):
-        """Removes all samples which contain nan values."""
+        """Removes all samples without a valid initial point. Other missing points
+        and the padding of shorter samples remain NaN and are excluded from the
+        fit."""
 
-        nan_mask = np.isnan(self.substrate_data).any(axis=1)
+        nan_mask = np.isnan(self.substrate_data[:, 0]) | np.isnan(self.time_data[:, 0])
 
         substrate_data = self.substrate_data[~nan_mask]
         product_data = self.product_data[~nan_mask]
@@ -608,7 +638,9 @@ class Estimator(sdRDM.DataModel):
         product_data: np.ndarray,
         time_data: np.ndarray,
     ):
-        """Subsets the data to a given time range."""
+        """Subsets the data to a given time range. Missing points are dropped, so
+        that the first valid point in the range holds the initial conditions of a
+        sample. Samples without valid points in the range are removed."""
         if min_time is None and max_time is not None:
             subset_slice = time_data < max_time
         elif min_time is not None and max_time is None:
@@ -618,12 +650,19 @@ class Estimator(sdRDM.DataModel):
         else:
             raise ValueError("Either min_time or max_time must be specified.")
 
-        return (
-            substrate_data[subset_slice].reshape(time_data.shape[0], -1),
-            enzyme_data[subset_slice].reshape(time_data.shape[0], -1),
-            product_data[subset_slice].reshape(time_data.shape[0], -1),
-            time_data[subset_slice].reshape(time_data.shape[0], -1),
+        subset_slice &= ~np.isnan(substrate_data)
+
+        # Samples may keep different numbers of points
+        data = compact_rows(
+            subset_slice, substrate_data, enzyme_data, product_data, time_data
         )
+        if not data[-1].size:
+            raise ValueError("No data points in the given time range.")
+
+        # Rows start with a valid point unless they are empty
+        valid_rows = ~np.isnan(data[-1][:, 0])
+
+        return [array[valid_rows] for array in data]
 
     def fit_models_fixed_params(
         self,
@@ -665,7 +704,62 @@ class Estimator(sdRDM.DataModel):
 
         display(self.fit_statistics())
 
-    def fit_models(self, min_time: float = None, max_time: float = None):
+    def fit_models(
+        self,
+        min_time: float = None,
+        max_time: float = None,
+        jacobian: Optional[str] = None,
+        solver: Optional[SolverSettings] = None,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        multistart: Optional[MultiStartSettings] = None,
+        warm_start: bool = False,
+        tournament: Optional[TournamentSettings] = None,
+        cache: Optional[FitCache] = None,
+        optimizer: str = "leastsq",
+        schedule: Optional[ResolutionSchedule] = None,
+    ):
+        """Fits all combinations of substrate and enzyme models to the data.
+
+        Args:
+            min_time (float, optional): Lower bound of the fitted time range.
+                Defaults to None.
+            max_time (float, optional): Upper bound of the fitted time range.
+                Defaults to None.
+            jacobian (str, optional): If 'sensitivity', residual Jacobians are
+                computed from the forward sensitivity equations. If 'parallel',
+                their finite differences are computed concurrently in worker
+                processes. Only supported by the 'leastsq' optimizer.
+                Defaults to None.
+            solver (SolverSettings, optional): Settings of the ODE solver such as
+                backend, method and tolerances. Defaults to None.
+            n_jobs (int, optional): Number of worker processes fitting reaction
+                systems in parallel. Defaults to None, fitting serially.
+            executor (Executor, optional): Executor used instead of a process pool
+                of 'n_jobs' workers. Defaults to None.
+            multistart (MultiStartSettings, optional): If given, each system is
+                fitted from several starting points and the best fit is kept.
+                Defaults to None.
+            warm_start (bool, optional): If True, systems whose parameters are a
+                superset of another system's parameters are fitted after it and
+                start from its estimates for the shared parameters. Cannot be
+                combined with a tournament. Defaults to False.
+            tournament (TournamentSettings, optional): If given, systems compete
+                in a successive-halving tournament and only the survivors are
+                fitted to convergence. Pruned systems are reported with the AIC
+                of their partial fit. Cannot be combined with parallel fitting or
+                warm starts. Defaults to None.
+            cache (FitCache, optional): On-disk cache of fit results. Systems
+                whose fit is cached are restored instead of refitted.
+                Defaults to None.
+            optimizer (str, optional): Optimizer of the fits, see
+                'ReactionSystem.fit'. Defaults to 'leastsq'.
+            schedule (ResolutionSchedule, optional): If given, each system is
+                fitted coarse-to-fine on progressively denser subsets of the time
+                points. The wall time of each stage is reported in the
+                'stage_times' of the system's result. Tournament rounds always
+                use all time points. Defaults to None.
+        """
         self._create_model_combinations()
 
         substrate, enzyme, product, time = self._remove_nans()
@@ -675,21 +769,232 @@ class Estimator(sdRDM.DataModel):
                 min_time, max_time, substrate, enzyme, product, time
             )
 
-        systems = tqdm(self.reaction_systems)
-        for system in systems:
-            systems.set_description(desc=f"Fitting {system.name} model")
-            report = system.fit(
+        fit_kwargs = dict(
+            substrate_data=substrate,
+            enzyme_data=enzyme,
+            product_data=product,
+            times=time,
+            jacobian=jacobian,
+            solver=solver,
+            multistart=multistart,
+            cache=cache,
+            optimizer=optimizer,
+            schedule=schedule,
+        )
+
+        if tournament is not None:
+            if executor is not None or (n_jobs is not None and n_jobs > 1):
+                raise ValueError(
+                    "A model tournament cannot be combined with parallel fitting."
+                )
+            if warm_start:
+                raise ValueError(
+                    "A model tournament cannot be combined with warm starts."
+                )
+            self._fit_tournament(fit_kwargs, tournament)
+        elif executor is not None or (n_jobs is not None and n_jobs > 1):
+            self._fit_in_parallel(
+                self._fitting_generations(warm_start=warm_start),
+                fit_kwargs,
+                n_jobs=n_jobs,
+                executor=executor,
+            )
+        else:
+            generations = self._fitting_generations(warm_start=warm_start)
+            systems = tqdm([pair for generation in generations for pair in generation])
+            for system, parents in systems:
+                systems.set_description(desc=f"Fitting {system.name} model")
+                self._warm_start(system, parents)
+                report = system.fit(**fit_kwargs)
+
+        self.reaction_systems.sort(
+            key=lambda x: float("inf") if x.result.AIC is None else x.result.AIC
+        )
+
+        display(self.fit_statistics())
+
+    def compare_optimizers(
+        self,
+        optimizers: tuple = ("leastsq", "trf", "dogbox", "lbfgsb", "nelder"),
+        min_time: float = None,
+        max_time: float = None,
+    ) -> pd.DataFrame:
+        """Fits copies of every reaction system with several optimizers and
+        reports wall time, number of function evaluations, final sum of squared
+        errors and agreement of the estimates. Reaction systems are created if
+        models have not been fitted yet, existing fits are not modified.
+
+        Args:
+            optimizers (tuple, optional): Optimizers to compare, see
+                'ReactionSystem.fit'. Defaults to all optimizers.
+            min_time (float, optional): Lower bound of the fitted time range.
+                Defaults to None.
+            max_time (float, optional): Upper bound of the fitted time range.
+                Defaults to None.
+
+        Returns:
+            pd.DataFrame: Comparison indexed by model and optimizer.
+        """
+        if not self.reaction_systems:
+            self._create_model_combinations()
+
+        substrate, enzyme, product, time = self._remove_nans()
+
+        if min_time or max_time:
+            substrate, enzyme, product, time = self._subset_time(
+                min_time, max_time, substrate, enzyme, product, time
+            )
+
+        comparisons = {}
+        for system in tqdm(self.reaction_systems, desc="Comparing optimizers"):
+            comparisons[system.name] = system.compare_optimizers(
                 substrate_data=substrate,
                 enzyme_data=enzyme,
                 product_data=product,
                 times=time,
+                optimizers=optimizers,
             )
 
-        self.reaction_systems.sort(
-            key=lambda x: float("inf") if x.result.AIC is None else x.result.AIC
+        return pd.concat(comparisons, names=["model"])
+
+    def _fit_in_parallel(
+        self,
+        generations: List[List[tuple]],
+        fit_kwargs: dict,
+        n_jobs: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """Fits copies of the reaction systems in worker processes, one generation
+        after the other, and writes the results back into the original systems in
+        their original order."""
+        pool = executor or ProcessPoolExecutor(max_workers=n_jobs)
+        progress = tqdm(
+            total=sum(len(generation) for generation in generations),
+            desc="Fitting models",
         )
 
-        display(self.fit_statistics())
+        try:
+            for generation in generations:
+                futures = []
+                for system, parents in generation:
+                    self._warm_start(system, parents)
+                    futures.append(
+                        pool.submit(_fit_reaction_system, system.to_dict(), fit_kwargs)
+                    )
+
+                for future in as_completed(futures):
+                    future.result()
+                    progress.update()
+
+                for (system, _), future in zip(generation, futures):
+                    system._apply_fit(ReactionSystem(**future.result()))
+                    if fit_kwargs["solver"] is not None:
+                        system._solver = fit_kwargs["solver"]
+        finally:
+            progress.close()
+            if executor is None:
+                pool.shutdown()
+
+    def _fit_tournament(self, fit_kwargs: dict, settings: TournamentSettings):
+        """Prunes the reaction systems in rounds of partial fits with growing
+        budgets and fits the survivors to convergence."""
+        partial_kwargs = {
+            key: value
+            for key, value in fit_kwargs.items()
+            if key not in ("multistart", "cache", "schedule")
+        }
+        survivors = list(self.reaction_systems)
+        budget = settings.initial_budget
+
+        while len(survivors) > settings.n_survivors:
+            rounds = tqdm(survivors, desc=f"Tournament with {budget} evaluations")
+            scores = [
+                system.partial_fit(max_nfev=int(budget), **partial_kwargs)
+                for system in rounds
+            ]
+
+            ranking = sorted(
+                range(len(survivors)),
+                key=lambda index: np.nan_to_num(scores[index], nan=np.inf),
+            )
+            kept = sorted(ranking[: settings.n_kept(len(survivors))])
+            for index in ranking[len(kept) :]:
+                survivors[index]._prune(scores[index])
+
+            survivors = [survivors[index] for index in kept]
+            budget *= settings.growth
+
+        systems = tqdm(survivors)
+        for system in systems:
+            systems.set_description(desc=f"Fitting {system.name} model")
+            system.fit(**fit_kwargs)
+            system.result.pruned = False
+
+    def _fitting_generations(self, warm_start: bool = True) -> List[List[tuple]]:
+        """Groups the reaction systems into generations of (system, parents) pairs.
+        The parents of a system are the systems with the most parameters among
+        those whose parameters are a proper subset of the system's parameters.
+        Parents belong to an earlier generation than their children."""
+        systems = list(self.reaction_systems)
+        if not warm_start:
+            return [[(system, []) for system in systems]]
+
+        param_sets = [
+            set().union(
+                *(reaction.model.eq_parameters for reaction in system.reactions)
+            )
+            for system in systems
+        ]
+
+        parents = []
+        for param_set in param_sets:
+            candidates = [
+                index for index, other in enumerate(param_sets) if other < param_set
+            ]
+            size = max((len(param_sets[index]) for index in candidates), default=0)
+            parents.append(
+                [index for index in candidates if len(param_sets[index]) == size]
+            )
+
+        # Proper subsets have fewer parameters, so parents precede their children
+        depths = [0] * len(systems)
+        for index in sorted(range(len(systems)), key=lambda i: len(param_sets[i])):
+            depths[index] = max(
+                (depths[parent] + 1 for parent in parents[index]), default=0
+            )
+
+        return [
+            [
+                (system, [systems[parent] for parent in system_parents])
+                for system, system_parents, system_depth in zip(
+                    systems, parents, depths
+                )
+                if system_depth == depth
+            ]
+            for depth in range(max(depths, default=-1) + 1)
+        ]
+
+    @staticmethod
+    def _warm_start(system: ReactionSystem, parents: List[ReactionSystem]):
+        """Sets the initial values of the parameters shared with the best fitted
+        parent system to the parent's estimates."""
+        fitted = [parent for parent in parents if parent.result.fit_success]
+        if not fitted:
+            return
+
+        parent = min(fitted, key=lambda parent: parent.result.AIC)
+        estimates = parent.fitted_params_dict
+        for reaction in system.reactions:
+            for param in reaction.model.parameters:
+                if param.name not in estimates or np.isnan(estimates[param.name]):
+                    continue
+
+                value = estimates[param.name]
+                if param.lower is not None:
+                    value = max(value, param.lower)
+                if param.upper is not None:
+                    value = min(value, param.upper)
+                param.initial_value = value
 
     def fit_statistics(self):
         header = np.array(
@@ -721,6 +1026,8 @@ class Estimator(sdRDM.DataModel):
             entry = dict.fromkeys(header[:, 0])
             entry["Model"] = system.name
             entry["AIC"] = system.result.AIC
+            if system.result.pruned:
+                entry["Model"] = f"{system.name} (pruned)"
             if not system.result.fit_success:
                 entries.append(entry)
                 continue
@@ -744,6 +1051,12 @@ class Estimator(sdRDM.DataModel):
                         entry[param.name] = float("nan")
 
                 kcat_km = kcat / km
+                if kcat_stdev is None or km_stdev is None:
+                    # Optimizers without covariance estimate leave no stdev
+                    entry[
+                        f"{ParamType.K_CAT.value} / {ParamType.K_M.value}"
+                    ] = f"{kcat_km:.3f}"
+                    continue
                 kcat_km_stdev = kcat_km * np.sqrt(
                     (kcat_stdev / kcat) ** 2 + (km_stdev / km) ** 2
                 )
@@ -1068,6 +1381,120 @@ class Estimator(sdRDM.DataModel):
                     if replicate.id == replicate_id:
                         species.replicates.remove(replicate)
 
+        self.invalidate_data()
+
+    def invalidate_data(self):
+        """Discards the cached data arrays and species lookups. Added, removed or
+        replaced reactions, species, measurements, replicates and data arrays
+        are detected automatically, while values written into the data arrays
+        and reactions or measurement species edited in place require an
+        explicit call."""
+        self._data_view = None
+        self._data_source = None
+        self._index = None
+
+    def _lookup(self) -> dict:
+        """Index of species by id, of species ids by role and of measurement data
+        by species id. The index is rebuilt after reactions, species or
+        measurements were added or replaced."""
+        key = (
+            id(self.reactions),
+            len(self.reactions),
+            id(self.species),
+            len(self.species),
+            id(self.measurements),
+            len(self.measurements),
+        )
+        if self._index is None or key != self._index_key:
+            self._index = self._build_index()
+            self._index_key = key
+
+        return self._index
+
+    def _build_index(self) -> dict:
+        species = {}
+        for entry in self.species:
+            species.setdefault(entry.id, entry)
+
+        measurement_data = {}
+        for measurement in self.measurements:
+            for data in measurement.species:
+                measurement_data.setdefault(data.species_id, []).append(data)
+
+        measured_ids = set()
+        if self.measurements:
+            measured_ids = {data.species_id for data in self.measurements[0].species}
+
+        # Role of a species as the first educt or product it is listed as
+        element_roles = {}
+        # Last species listed with a role, and first measured species of a role
+        role_species = {}
+        measured_roles = {}
+        for reaction in self.reactions:
+            for element in (*reaction.educts, *reaction.products):
+                element_roles.setdefault(element.species_id, element.ontology)
+
+            for elements, role in (
+                (reaction.educts, SBOTerm.SUBSTRATE),
+                (reaction.products, SBOTerm.PRODUCT),
+                (reaction.modifiers, SBOTerm.PROTEIN),
+            ):
+                for element in elements:
+                    role_species[element.ontology] = element.species_id
+                    if (
+                        element.ontology == role.value
+                        and element.species_id in measured_ids
+                    ):
+                        measured_roles.setdefault(role.value, element.species_id)
+
+        return dict(
+            species=species,
+            measurement_data=measurement_data,
+            element_roles=element_roles,
+            role_species=role_species,
+            measured_roles=measured_roles,
+        )
+
+    def _cached_data(self, key: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+        """Measurement data as a contiguous, read-only float64 array of shape
+        (replicates, time points). Arrays are built once and shared by fitting,
+        parameter initialization and plotting until the species lookups are
+        rebuilt, the measured reactant or the measurement data change or
+        'invalidate_data' is called."""
+        lookup, reactant = self._lookup(), self.measured_reactant
+        signature, objects = self._data_signature()
+        if (
+            self._data_view is None
+            or lookup is not self._data_source[0]
+            or reactant is not self._data_source[1]
+            or signature != self._data_source[2]
+        ):
+            self._data_view = {}
+            # The objects are kept alive, so that their ids are not reused
+            self._data_source = (lookup, reactant, signature, objects)
+
+        if key not in self._data_view:
+            array = np.ascontiguousarray(build(), dtype=np.float64)
+            array.setflags(write=False)
+            self._data_view[key] = array
+
+        return self._data_view[key]
+
+    def _data_signature(self) -> Tuple[tuple, list]:
+        """Ids and sizes of the measurement data, replicates and data arrays,
+        which change if any of them is added, removed or replaced, together
+        with the objects themselves."""
+        objects, sizes = [], []
+        for measurement in self.measurements:
+            for data in measurement.species:
+                objects += (data, data.replicates)
+                sizes += (data.init_conc, len(data.replicates))
+                for replicate in data.replicates:
+                    objects += (replicate, replicate.time, replicate.data)
+                    sizes += (replicate.time.size, replicate.data.size)
+
+        return (tuple(map(id, objects)), tuple(sizes)), objects
+
     @property
     def ph(self):
         if not all(
@@ -1163,14 +1590,9 @@ class Estimator(sdRDM.DataModel):
 
     @property
     def measured_reactant_role(self) -> SBOTerm:
-        for reaction in self.reactions:
-            for educt in reaction.educts:
-                if educt.species_id == self.measured_reactant.id:
-                    return SBOTerm(educt.ontology)
-
-            for product in reaction.products:
-                if product.species_id == self.measured_reactant.id:
-                    return SBOTerm(product.ontology)
+        ontology = self._lookup()["element_roles"].get(self.measured_reactant.id)
+        if ontology is not None:
+            return SBOTerm(ontology)
 
         raise ValueError(
             f"Measured reactant '{self.measured_reactant}' not found in the defined"
@@ -1179,39 +1601,21 @@ class Estimator(sdRDM.DataModel):
 
     @property
     def substrate(self):
-        ids = []
-        for reaction in self.reactions:
-            for educt in reaction.educts:
-                if educt.ontology == SBOTerm.SUBSTRATE.value:
-                    ids.append(educt.species_id)
-
-        for id in ids:
-            if id in [species.species_id for species in self.measurements[0].species]:
-                return self._get_species(id)
+        return self._get_measured_species_of_role(SBOTerm.SUBSTRATE)
 
     @property
     def product(self):
-        ids = []
-        for reaction in self.reactions:
-            for product in reaction.products:
-                if product.ontology == SBOTerm.PRODUCT.value:
-                    ids.append(product.species_id)
-
-        for id in ids:
-            if id in [species.species_id for species in self.measurements[0].species]:
-                return self._get_species(id)
+        return self._get_measured_species_of_role(SBOTerm.PRODUCT)
 
     @property
     def enzyme(self):
-        ids = []
-        for reaction in self.reactions:
-            for modifier in reaction.modifiers:
-                if modifier.ontology == SBOTerm.PROTEIN.value:
-                    ids.append(modifier.species_id)
+        return self._get_measured_species_of_role(SBOTerm.PROTEIN)
 
-        for id in ids:
-            if id in [species.species_id for species in self.measurements[0].species]:
-                return self._get_species(id)
+    def _get_measured_species_of_role(self, role: SBOTerm):
+        """First species of a role in the reactions which has measurement data."""
+        species_id = self._lookup()["measured_roles"].get(role.value)
+        if species_id is not None:
+            return self._get_species(species_id)
 
     @property
     def inhibitor(self):
@@ -1219,6 +1623,9 @@ class Estimator(sdRDM.DataModel):
 
     @property
     def init_substrate_data(self):
+        return self._cached_data("init_substrate", self._get_init_substrate_data)
+
+    def _get_init_substrate_data(self) -> np.ndarray:
         init_substrates = []
         for n_replicates, measurement in zip(
             self._measurement_replicates, self.measurements
@@ -1233,6 +1640,9 @@ class Estimator(sdRDM.DataModel):
 
     @property
     def substrate_data(self):
+        return self._cached_data("substrate", self._get_substrate_data)
+
+    def _get_substrate_data(self) -> np.ndarray:
         if self.measured_reactant_role == SBOTerm.SUBSTRATE:
             return self._get_measured_data(self.substrate)
         else:
@@ -1240,6 +1650,9 @@ class Estimator(sdRDM.DataModel):
 
     @property
     def product_data(self):
+        return self._cached_data("product", self._get_product_data)
+
+    def _get_product_data(self) -> np.ndarray:
         if self.measured_reactant_role == SBOTerm.PRODUCT:
             return self._get_measured_data(self.product)
         else:
@@ -1251,7 +1664,7 @@ class Estimator(sdRDM.DataModel):
             for replicate in measurement.replicates:
                 measurement_data.append(replicate.data)
 
-        return np.array(measurement_data).reshape(sum(self._measurement_replicates), -1)
+        return pad_rows(measurement_data)
 
     def _calculate_missing_reactant(self, existing_reactant: Reactant):
         # calculate_product
@@ -1274,15 +1687,21 @@ class Estimator(sdRDM.DataModel):
 
     @property
     def time_data(self):
+        return self._cached_data("time", self._get_time_data)
+
+    def _get_time_data(self) -> np.ndarray:
         time_data = []
         for measurement in self._get_species_data(self.measured_reactant):
             for replicate in measurement.replicates:
                 time_data.append(replicate.time)
 
-        return np.array(time_data).reshape(sum(self._measurement_replicates), -1)
+        return pad_rows(time_data)
 
     @property
     def enzyme_data(self):
+        return self._cached_data("enzyme", self._get_enzyme_data)
+
+    def _get_enzyme_data(self) -> np.ndarray:
         enzyme_data = []
         for n_reps, measurement in zip(self._measurement_replicates, self.measurements):
             for data in measurement.species:
@@ -1314,25 +1733,16 @@ class Estimator(sdRDM.DataModel):
         )
 
     def _get_species_of_role(self, role: SBOTerm):
-        for reaction in self.reactions:
-            for educt in reaction.educts:
-                if educt.ontology == role.value:
-                    species_id = educt.species_id
-
-            for product in reaction.products:
-                if product.ontology == role.value:
-                    species_id = product.species_id
-
-            for modifier in reaction.modifiers:
-                if modifier.ontology == role.value:
-                    species_id = modifier.species_id
+        species_id = self._lookup()["role_species"].get(role.value)
+        if species_id is None:
+            raise ValueError(f"No species with role '{role.name}' in the reactions.")
 
         return self._get_species(species_id)
 
     def _get_species(self, species_id: str):
-        for species in self.species:
-            if species.id == species_id:
-                return species
+        species = self._lookup()["species"].get(species_id)
+        if species is not None:
+            return species
 
         raise ValueError(
             f"Species '{species_id}' not found in species "
@@ -1366,12 +1776,7 @@ class Estimator(sdRDM.DataModel):
                     return species.unit
 
     def _get_species_data(self, species: AbstractSpecies) -> MeasurementData:
-        species_measurements = []
-        for measurment in self.measurements:
-            for data in measurment.species:
-                if data.species_id == species.id:
-                    species_measurements.append(data)
-        return species_measurements
+        return list(self._lookup()["measurement_data"].get(species.id, []))
 
     @classmethod
     def from_enzymeml(
@@ -1419,8 +1824,8 @@ class Estimator(sdRDM.DataModel):
                 for replicate, color in zip(species.replicates, colors):
                     fig.add_trace(
                         go.Scatter(
-                            x=np.array(replicate.time),
-                            y=np.array(replicate.data),
+                            x=replicate.time,
+                            y=replicate.data,
                             mode="markers",
                             marker=dict(color=color),
                             name=replicate.id,
@@ -1471,7 +1876,7 @@ class Estimator(sdRDM.DataModel):
         # Initialize figure
 
         if min_time is None:
-            min_time = self.time_data.min()
+            min_time = np.nanmin(self.time_data)
             index = 0
         else:
             index = min(np.where(self.time_data[0] > min_time)[0])
@@ -1550,7 +1955,7 @@ class Estimator(sdRDM.DataModel):
         ]
         systems = sorted(systems, key=lambda system: system.result.AIC)
 
-        dense_time = np.linspace(min_time, max(self.time_data.flatten()), 100)
+        dense_time = np.linspace(min_time, np.nanmax(self.time_data), 100)
 
         for system in systems:
             substrate_data = self._get_species_data(self.substrate)
@@ -1753,3 +2158,11 @@ class Estimator(sdRDM.DataModel):
             any(fig["customdata"][0] == trace for trace in visible_traces)
             for fig in fig_data
         ]
+
+
+def _fit_reaction_system(system: dict, fit_kwargs: dict) -> dict:
+    """Fits a reaction system from its dict representation in a worker process."""
+    reaction_system = ReactionSystem(**system)
+    reaction_system.fit(**fit_kwargs)
+
+    return reaction_system.to_dict()
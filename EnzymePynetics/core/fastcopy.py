@@ -0,0 +1,45 @@
+import copy
+
+from pydantic import BaseModel, ValidationError
+
+from .kineticmodel import KineticModel
+
+
+def fast_copy(original: BaseModel, **update) -> BaseModel:
+    """Copies a validated model without validating its values again.
+
+    Sub-objects are shared with the original, while lists are copied, so that
+    replacing items of a list of the copy does not affect the original. Values
+    given in 'update' are validated by their field, like on assignment, unless
+    they are validated models themselves.
+    """
+    values = {
+        name: copy.copy(value)
+        for name, value in original.__dict__.items()
+        if isinstance(value, list) and name not in update
+    }
+    for name, value in update.items():
+        if not isinstance(value, BaseModel):
+            value = _validate_field(original, name, value)
+        values[name] = value
+
+    return original.copy(update=values)
+
+
+def copy_kinetic_model(model: KineticModel) -> KineticModel:
+    """Copies a kinetic model together with its parameters, which are modified
+    by fits."""
+    return fast_copy(
+        model, parameters=[fast_copy(parameter) for parameter in model.parameters]
+    )
+
+
+def _validate_field(original: BaseModel, name: str, value):
+    model = type(original)
+    value, errors = model.__fields__[name].validate(
+        value, original.__dict__, loc=name, cls=model
+    )
+    if errors:
+        raise ValidationError([errors], model)
+
+    return value
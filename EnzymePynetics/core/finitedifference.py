@@ -0,0 +1,110 @@
+import os
+import numpy as np
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from lmfit import Parameters
+
+from .solver import SolverSettings
+
+# Reaction system and fit data of a worker process, set by '_init_worker'
+_worker = {}
+
+
+class ParallelJacobian:
+    """Forward-difference Jacobian of the residuals of a reaction system, whose
+    perturbed residual vectors are computed concurrently in a process pool.
+
+    Each Jacobian evaluation simulates the unperturbed and all perturbed parameter
+    sets at once, so that an iteration of the optimizer takes about the wall time
+    of a single simulation instead of one simulation per varied parameter. The
+    reaction system and the fit data are sent to the workers only once, when the
+    pool is started.
+
+    Args:
+        system (dict): Reaction system as given by 'to_dict'.
+        solver (SolverSettings): Settings of the ODE solver.
+        args (tuple): Times, initial conditions and substrate data of the fit.
+        n_jobs (int, optional): Number of worker processes. Defaults to None,
+            using one process per residual vector up to the number of CPUs.
+        rel_step (float, optional): Relative step size. Defaults to the square
+            root of the machine precision, as used by MINPACK.
+    """
+
+    def __init__(
+        self,
+        system: dict,
+        solver: SolverSettings,
+        args: tuple,
+        n_jobs: Optional[int] = None,
+        rel_step: float = np.sqrt(np.finfo(float).eps),
+    ):
+        self.system = system
+        self.solver = solver
+        self.args = args
+        self.n_jobs = n_jobs
+        self.rel_step = rel_step
+        self._pool = None
+
+    def __enter__(self) -> "ParallelJacobian":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shuts down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __call__(self, params: Parameters, *args) -> np.ndarray:
+        """Jacobian of the residuals with respect to the varied parameters, with
+        the signature of an lmfit 'Dfun'."""
+        names = [name for name, param in params.items() if param.vary]
+        steps = []
+        perturbed = [params.copy()]
+
+        for name in names:
+            param = params[name]
+            step = self.rel_step * max(abs(param.value), 1.0)
+            # Steps towards the inside of the bounds
+            if param.value + step > param.max:
+                step = -step
+            steps.append(step)
+
+            point = params.copy()
+            point[name].set(value=param.value + step)
+            perturbed.append(point)
+
+        pool = self._start(len(perturbed))
+        base, *columns = pool.map(_perturbed_residuals, perturbed)
+
+        return np.column_stack(
+            [(column - base) / step for column, step in zip(columns, steps)]
+        )
+
+    def _start(self, n_vectors: int) -> ProcessPoolExecutor:
+        if self._pool is None:
+            n_jobs = self.n_jobs or min(n_vectors, os.cpu_count() or 1)
+            self._pool = ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_init_worker,
+                initargs=(self.system, self.solver, self.args),
+            )
+
+        return self._pool
+
+
+def _init_worker(system: dict, solver: SolverSettings, args: tuple):
+    from .reactionsystem import ReactionSystem
+
+    reaction_system = ReactionSystem(**system)
+    reaction_system._solver = solver
+
+    _worker["system"] = reaction_system
+    _worker["args"] = args
+
+
+def _perturbed_residuals(params: Parameters) -> np.ndarray:
+    return _worker["system"].residuals(params, *_worker["args"])
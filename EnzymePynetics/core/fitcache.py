@@ -0,0 +1,108 @@
+import os
+import json
+import hashlib
+import tempfile
+import numpy as np
+
+from dataclasses import asdict, is_dataclass
+from typing import Optional
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = os.environ.get(
+    "ENZYMEPYNETICS_FIT_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "EnzymePynetics", "fits"),
+)
+
+
+class FitCache:
+    """Directory of fit results keyed by a hash of everything a fit depends on.
+
+    Each entry is a compact JSON file. Reading an entry marks it as recently
+    used, and once the directory exceeds `max_size` bytes, the least recently
+    used entries are evicted.
+
+    Args:
+        directory (str, optional): Cache directory. Defaults to the environment
+            variable 'ENZYMEPYNETICS_FIT_CACHE' or '~/.cache/EnzymePynetics/fits'.
+        max_size (int, optional): Maximum size of the cache in bytes.
+            Defaults to 64 MB.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_size: int = 64 * 2**20):
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.max_size = max_size
+
+    @staticmethod
+    def key(*items) -> str:
+        """Hashes arrays, dataclasses and JSON-serializable items to a key."""
+        digest = hashlib.sha256(f"{CACHE_VERSION}".encode())
+
+        for item in items:
+            if isinstance(item, np.ndarray):
+                array = np.ascontiguousarray(item, dtype=np.float64)
+                digest.update(f"array{array.shape}".encode())
+                digest.update(array.tobytes())
+            else:
+                if is_dataclass(item):
+                    item = {type(item).__name__: asdict(item)}
+                digest.update(json.dumps(item, sort_keys=True, default=str).encode())
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Returns the cached entry of 'key' or None."""
+        path = self._path(key)
+
+        try:
+            with open(path) as file:
+                entry = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        return entry
+
+    def put(self, key: str, entry: dict):
+        """Stores 'entry' under 'key' and evicts least recently used entries."""
+        os.makedirs(self.directory, exist_ok=True)
+
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w") as file:
+            json.dump(entry, file, separators=(",", ":"), default=float)
+        os.replace(tmp_path, self._path(key))
+
+        self._evict()
+
+    def clear(self):
+        """Removes all cached entries."""
+        for path, _ in self._entries():
+            os.remove(path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _entries(self) -> list:
+        """Cache files with their stats, least recently used first."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(".json"):
+                    entries.append((entry.path, entry.stat()))
+
+        return sorted(entries, key=lambda entry: entry[1].st_mtime)
+
+    def _evict(self):
+        entries = self._entries()
+        size = sum(stat.st_size for _, stat in entries)
+
+        for path, stat in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= stat.st_size
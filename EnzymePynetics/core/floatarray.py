@@ -0,0 +1,47 @@
+import numpy as np
+
+
+class FloatArray:
+    """Field type holding a one-dimensional sequence of numbers as a contiguous
+    float64 array.
+
+    Values are converted in a single vectorized call instead of being validated
+    element by element, and consumers receive the array itself instead of
+    a list of boxed floats. Models with such fields serialize them as lists.
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: dict):
+        field_schema.update(type="array", items={"type": "number"})
+
+    @classmethod
+    def validate(cls, value) -> np.ndarray:
+        try:
+            array = np.array(value, dtype=np.float64)
+        except (TypeError, ValueError) as error:
+            raise TypeError(
+                f"Expected a sequence of numbers, got '{type(value).__name__}'."
+            ) from error
+
+        if array.ndim != 1:
+            raise ValueError(
+                f"Expected a one-dimensional sequence, got {array.ndim} dimensions."
+            )
+
+        return array
+
+    @staticmethod
+    def empty() -> np.ndarray:
+        return np.empty(0, dtype=np.float64)
+
+
+def arrays_to_lists(data: dict) -> dict:
+    """Replaces arrays among the values of 'data' by lists."""
+    return {
+        key: value.tolist() if isinstance(value, np.ndarray) else value
+        for key, value in data.items()
+    }
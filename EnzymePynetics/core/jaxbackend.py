@@ -0,0 +1,150 @@
+import numpy as np
+import sympy as sp
+
+from typing import List
+
+try:
+    import jax
+    import jax.numpy as jnp
+    from jax.experimental.ode import odeint
+except ImportError:
+    jax = None
+
+
+def jax_available() -> bool:
+    return jax is not None
+
+
+class JaxModel:
+    """Reaction system integrated with JAX on CPU.
+
+    The rate laws are lambdified to JAX, integrated with the adaptive Dormand-Prince
+    solver of 'jax.experimental.ode' and vectorized over replicates with 'vmap',
+    so that all replicates are simulated by a single XLA-compiled kernel. Parameter
+    derivatives are obtained by integrating the forward sensitivity system
+    dS/dt = J S + df/dp, as in 'CompiledModel.sensitivity_model', whose Jacobians
+    are derived from the rate laws by automatic differentiation. This adds one
+    tangent per parameter to the states, while reverse-mode differentiation
+    through the solver needs one adjoint pass per simulated point.
+
+    Args:
+        rate_laws (List[sp.Expr]): Rate law of each species.
+        species_symbols (List[sp.Symbol]): Species symbols in state vector order.
+        param_symbols (List[sp.Symbol]): Parameter symbols in parameter vector order.
+        rtol (float): Relative tolerance of the solver.
+        atol (float): Absolute tolerance of the solver.
+        max_steps (int): Maximum number of solver steps per output time point.
+    """
+
+    def __init__(
+        self,
+        rate_laws: List[sp.Expr],
+        species_symbols: List[sp.Symbol],
+        param_symbols: List[sp.Symbol],
+        rtol: float,
+        atol: float,
+        max_steps: int,
+    ):
+        if jax is None:
+            raise ImportError("JAX is required for the 'jax' solver backend.")
+
+        # Parameters are estimated in double precision, which is a global setting
+        # of JAX and therefore left to the application
+        if not jax.config.jax_enable_x64:
+            raise RuntimeError(
+                "The 'jax' solver backend requires 64-bit precision. Enable it with"
+                " jax.config.update('jax_enable_x64', True) before using JAX."
+            )
+
+        rhs = sp.lambdify([species_symbols, param_symbols], rate_laws, "jax")
+
+        def ode_model(species, time, params):
+            return jnp.stack(
+                [
+                    jnp.asarray(rate, dtype=species.dtype)
+                    for rate in rhs(species, params)
+                ]
+            )
+
+        def simulate_replicate(init_condition, time, params):
+            return odeint(
+                ode_model,
+                init_condition,
+                time,
+                params,
+                rtol=rtol,
+                atol=atol,
+                mxstep=max_steps,
+            )
+
+        n_species, n_params = len(species_symbols), len(param_symbols)
+        species_jacobian = jax.jacfwd(ode_model, argnums=0)
+        param_jacobian = jax.jacfwd(ode_model, argnums=2)
+
+        def sensitivity_model(augmented, time, params):
+            species = augmented[:n_species]
+            sensitivities = augmented[n_species:].reshape(n_species, n_params)
+            rates = species_jacobian(species, time, params) @ sensitivities
+            rates = rates + param_jacobian(species, time, params)
+
+            return jnp.concatenate(
+                [ode_model(species, time, params), rates.reshape(-1)]
+            )
+
+        def sensitivities_replicate(init_condition, time, params):
+            augmented = odeint(
+                sensitivity_model,
+                jnp.concatenate([init_condition, jnp.zeros(n_species * n_params)]),
+                time,
+                params,
+                rtol=rtol,
+                atol=atol,
+                mxstep=max_steps,
+            )
+
+            return augmented[:, n_species:].reshape(-1, n_species, n_params)
+
+        simulate = jax.vmap(simulate_replicate, in_axes=(0, 0, None))
+
+        self._simulate = jax.jit(simulate)
+        self._sensitivities = jax.jit(
+            jax.vmap(sensitivities_replicate, in_axes=(0, 0, None))
+        )
+        self._simulate_ensemble = jax.jit(jax.vmap(simulate, in_axes=(None, None, 0)))
+
+    def simulate(
+        self, times: np.ndarray, init_conditions: np.ndarray, params: np.ndarray
+    ) -> np.ndarray:
+        """Simulated species of shape (replicates, time points, species)."""
+        return np.asarray(self._simulate(*self._inputs(times, init_conditions, params)))
+
+    def simulate_ensemble(
+        self, times: np.ndarray, init_conditions: np.ndarray, params: np.ndarray
+    ) -> np.ndarray:
+        """Simulated species for a matrix of parameter sets of shape (sets,
+        parameters). Returns shape (sets, replicates, time points, species)."""
+        return np.asarray(
+            self._simulate_ensemble(*self._inputs(times, init_conditions, params))
+        )
+
+    def sensitivities(
+        self, times: np.ndarray, init_conditions: np.ndarray, params: np.ndarray
+    ) -> np.ndarray:
+        """Derivatives of the simulated species with respect to the parameters of
+        shape (replicates, time points, species, parameters)."""
+        return np.asarray(
+            self._sensitivities(*self._inputs(times, init_conditions, params))
+        )
+
+    @staticmethod
+    def _inputs(times: np.ndarray, init_conditions: np.ndarray, params: np.ndarray):
+        init_conditions = np.atleast_2d(init_conditions).astype(float)
+        times = np.broadcast_to(
+            np.atleast_2d(times), (init_conditions.shape[0], np.shape(times)[-1])
+        ).astype(float)
+
+        return (
+            jnp.asarray(init_conditions),
+            jnp.asarray(times),
+            jnp.asarray(params, dtype=float),
+        )
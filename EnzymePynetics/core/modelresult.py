@@ -49,6 +49,27 @@ class ModelResult(sdRDM.DataModel):
         default=None,
         description="Root mean square deviation between model and measurement data.",
     )
+
+    n_starts: Optional[int] = Field(
+        default=None,
+        description="Number of starting points of a multi-start fit.",
+    )
+
+    n_converged: Optional[int] = Field(
+        default=None,
+        description="Number of starting points converged to the best optimum.",
+    )
+
+    pruned: Optional[bool] = Field(
+        default=None,
+        description="Whether the model was pruned in a model tournament.",
+    )
+
+    stage_times: List[float] = Field(
+        description="Wall time in seconds of each stage of a coarse-to-fine fit.",
+        default_factory=ListPlus,
+        multiple=True,
+    )
     __repo__: Optional[str] = PrivateAttr(
         default="https://github.com/haeussma/EnzymePynetics"
     )
@@ -0,0 +1,113 @@
+import numpy as np
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from lmfit import Parameters
+from lmfit.minimizer import MinimizerResult
+from scipy.stats import qmc
+
+SAMPLINGS = ("sobol", "lhs")
+
+
+@dataclass
+class MultiStartSettings:
+    """Settings of multi-start fitting, where a reaction system is fitted from
+    several starting points and the best solution is kept.
+
+    Attributes:
+        n_starts (int): Number of starting points, including the initial values of
+            the parameters. The remaining points are sampled within the parameter
+            bounds. Defaults to 16.
+        sampling (str): 'sobol' or 'lhs' (Latin hypercube). Defaults to 'sobol'.
+        n_jobs (int, optional): Number of worker processes fitting starting points
+            in parallel. Defaults to None, fitting serially.
+        timeout (float, optional): Time in seconds shared by all starts, after
+            which running fits are stopped and pending ones are skipped.
+            Defaults to None.
+        rtol (float): Relative tolerance of the chi-square within which a start is
+            counted as converged to the best optimum. Defaults to 1e-3.
+        seed (int, optional): Seed of the sampler. Defaults to None.
+    """
+
+    n_starts: int = 16
+    sampling: str = "sobol"
+    n_jobs: Optional[int] = None
+    timeout: Optional[float] = None
+    rtol: float = 1e-3
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if self.sampling not in SAMPLINGS:
+            raise ValueError(
+                f"Unknown sampling '{self.sampling}'. Use one of {SAMPLINGS}."
+            )
+        if self.n_starts < 1:
+            raise ValueError("At least one starting point is required.")
+
+
+def draw_starting_points(
+    params: Parameters, settings: MultiStartSettings
+) -> List[Parameters]:
+    """Draws starting points of the varied parameters within their bounds.
+    Parameters bounded by positive values are sampled uniformly on a log scale,
+    parameters without finite bounds keep their initial value.
+
+    Args:
+        params (Parameters): Parameters holding initial values and bounds.
+        settings (MultiStartSettings): Multi-start settings.
+
+    Returns:
+        List[Parameters]: Copies of 'params', starting with the initial values.
+    """
+    names = [
+        name
+        for name, param in params.items()
+        if param.vary and np.isfinite(param.min) and np.isfinite(param.max)
+    ]
+    n_samples = settings.n_starts - 1
+
+    if not names or not n_samples:
+        return [params]
+
+    if settings.sampling == "sobol":
+        # Sobol sequences are drawn in powers of two to keep their balance
+        sampler = qmc.Sobol(d=len(names), seed=settings.seed)
+        samples = sampler.random_base2(int(np.ceil(np.log2(n_samples))))[:n_samples]
+    else:
+        sampler = qmc.LatinHypercube(d=len(names), seed=settings.seed)
+        samples = sampler.random(n_samples)
+
+    starts = [params]
+    for sample in samples:
+        start = params.copy()
+        for name, quantile in zip(names, sample):
+            lower, upper = start[name].min, start[name].max
+            if lower > 0:
+                value = np.exp(np.log(lower) + quantile * np.log(upper / lower))
+            else:
+                value = lower + quantile * (upper - lower)
+            start[name].set(value=value)
+        starts.append(start)
+
+    return starts
+
+
+def select_best(
+    results: List[Optional[MinimizerResult]], rtol: float
+) -> Tuple[Optional[MinimizerResult], int]:
+    """Returns the successful fit with the lowest chi-square and the number of
+    fits which converged to it. Falls back to the first finished fit if none was
+    successful."""
+    finished = [result for result in results if result is not None]
+    successful = [result for result in finished if result.success]
+
+    if not successful:
+        return (finished[0] if finished else None), 0
+
+    best = min(successful, key=lambda result: result.chisqr)
+    n_converged = sum(
+        result.chisqr <= best.chisqr * (1 + rtol) + np.finfo(float).tiny
+        for result in successful
+    )
+
+    return best, n_converged
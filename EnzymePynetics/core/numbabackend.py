@@ -0,0 +1,137 @@
+import os
+import hashlib
+import importlib.util
+import tempfile
+import sympy as sp
+
+from types import ModuleType
+from typing import List, Optional, Tuple
+from sympy.printing.pycode import pycode
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+CODEGEN_VERSION = 1
+DEFAULT_CACHE_DIR = os.environ.get(
+    "ENZYMEPYNETICS_NUMBA_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "EnzymePynetics", "numba"),
+)
+
+MODULE_TEMPLATE = """\
+# Generated by EnzymePynetics, do not edit.
+import math
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def ode_model(species, time, params):
+{unpack_params}
+    rates = np.empty(species.size)
+    for offset in range(0, species.size, {n_species}):
+{unpack_species}
+{rates}
+    return rates
+
+
+@njit(cache=True)
+def ode_jacobian(species, time, params):
+{unpack_params}
+    banded = np.zeros(({n_bands}, species.size))
+    for offset in range(0, species.size, {n_species}):
+{unpack_species}
+{jacobian}
+    return banded
+"""
+
+
+def numba_available() -> bool:
+    return numba is not None
+
+
+def compile_rate_laws(
+    rate_laws: List[sp.Expr],
+    jacobian: List[Tuple[int, int, sp.Expr]],
+    species_symbols: List[sp.Symbol],
+    param_symbols: List[sp.Symbol],
+    cache_dir: Optional[str] = None,
+) -> ModuleType:
+    """Emits Numba-jitted right-hand side and banded Jacobian functions with the
+    calling convention of 'CompiledModel.ode_model' and 'CompiledModel.ode_jacobian'.
+
+    The generated module is written to 'cache_dir' under the hash of the equations,
+    so that Numba's on-disk cache of the compiled functions is reused by other
+    processes and later sessions.
+
+    Args:
+        rate_laws (List[sp.Expr]): Rate law of each species.
+        jacobian (List[Tuple[int, int, sp.Expr]]): Non-zero entries of the Jacobian
+            with respect to the species as (row, column, expression).
+        species_symbols (List[sp.Symbol]): Species symbols in state vector order.
+        param_symbols (List[sp.Symbol]): Parameter symbols in parameter vector order.
+        cache_dir (str, optional): Directory of the generated modules. Defaults
+            to 'DEFAULT_CACHE_DIR'.
+
+    Returns:
+        ModuleType: Module holding 'ode_model' and 'ode_jacobian'.
+    """
+    if numba is None:
+        raise ImportError("Numba is required for the 'numba' rate law backend.")
+
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    n_species = len(species_symbols)
+    bandwidth = n_species - 1
+
+    # Replace user-defined names by positional names, which are valid identifiers
+    names = {
+        symbol: sp.Symbol(f"y_{index}") for index, symbol in enumerate(species_symbols)
+    } | {symbol: sp.Symbol(f"p_{index}") for index, symbol in enumerate(param_symbols)}
+
+    source = MODULE_TEMPLATE.format(
+        n_species=n_species,
+        n_bands=2 * bandwidth + 1,
+        unpack_params="\n".join(
+            f"    p_{index} = params[{index}]" for index in range(len(param_symbols))
+        )
+        or "    pass",
+        unpack_species="\n".join(
+            f"        y_{index} = species[offset + {index}]"
+            for index in range(n_species)
+        ),
+        rates="\n".join(
+            f"        rates[offset + {row}] = {_print(rate_law.xreplace(names))}"
+            for row, rate_law in enumerate(rate_laws)
+        ),
+        jacobian="\n".join(
+            f"        banded[{row - col + bandwidth}, offset + {col}] = "
+            f"{_print(expression.xreplace(names))}"
+            for row, col, expression in jacobian
+        )
+        or "        pass",
+    )
+
+    digest = hashlib.sha256(
+        f"{CODEGEN_VERSION}\n{numba.__version__}\n{source}".encode()
+    ).hexdigest()[:16]
+    module_name = f"rate_laws_{digest}"
+    path = os.path.join(cache_dir, f"{module_name}.py")
+
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write atomically, since several worker processes may compile at once
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w") as file:
+            file.write(source)
+        os.replace(tmp_path, path)
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def _print(expression: sp.Expr) -> str:
+    return pycode(expression, fully_qualified_modules=True)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from typing import List, Tuple
+
+# Optimizer names mapped to the lmfit method and its solver keywords
+OPTIMIZERS = {
+    "leastsq": ("leastsq", {}),
+    "trf": ("least_squares", dict(method="trf", x_scale="jac")),
+    "dogbox": ("least_squares", dict(method="dogbox", x_scale="jac")),
+    "lbfgsb": ("lbfgsb", {}),
+    "nelder": ("nelder", {}),
+}
+
+
+def lmfit_method(optimizer: str) -> Tuple[str, dict]:
+    """Returns the lmfit method and solver keywords of an optimizer.
+
+    Args:
+        optimizer (str): 'leastsq' (Levenberg-Marquardt), 'trf' or 'dogbox'
+            (trust-region 'least_squares' with Jacobian scaling), 'lbfgsb'
+            (bounded L-BFGS on the sum of squares) or 'nelder' (Nelder-Mead).
+
+    Returns:
+        Tuple[str, dict]: lmfit method name and keywords passed to the solver.
+    """
+    if optimizer not in OPTIMIZERS:
+        raise ValueError(
+            f"Unknown optimizer '{optimizer}'. Use one of {list(OPTIMIZERS)}."
+        )
+
+    method, fit_kws = OPTIMIZERS[optimizer]
+
+    return method, dict(fit_kws)
+
+
+def compare_runs(runs: List[dict]) -> pd.DataFrame:
+    """Tabulates optimizer runs and their agreement with the run of lowest sum
+    of squared errors.
+
+    Args:
+        runs (List[dict]): Runs with keys 'optimizer', 'wall_time', 'nfev', 'sse',
+            'success' and 'params', the latter mapping names to values.
+
+    Returns:
+        pd.DataFrame: One row per optimizer with the maximum relative deviation of
+            its parameters from the best run.
+    """
+    finite = [run for run in runs if np.isfinite(run["sse"])]
+    best = min(finite, key=lambda run: run["sse"]) if finite else None
+
+    rows = []
+    for run in runs:
+        deviation = np.nan
+        if best is not None and np.isfinite(run["sse"]):
+            deviation = max(
+                (
+                    abs(value - best["params"][name]) / abs(best["params"][name])
+                    for name, value in run["params"].items()
+                    if best["params"][name] != 0
+                ),
+                default=0.0,
+            )
+        rows.append(
+            dict(
+                optimizer=run["optimizer"],
+                wall_time=run["wall_time"],
+                nfev=run["nfev"],
+                sse=run["sse"],
+                success=run["success"],
+                max_rel_deviation=deviation,
+            )
+        )
+
+    return pd.DataFrame(rows).set_index("optimizer")
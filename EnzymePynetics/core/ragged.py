@@ -0,0 +1,41 @@
+import numpy as np
+
+from typing import Iterable, List
+
+
+def pad_rows(rows: Iterable[np.ndarray]) -> np.ndarray:
+    """Stacks one-dimensional rows of possibly different lengths into a float64
+    array of shape (rows, longest row). Shorter rows are padded with NaN, which
+    marks points that are excluded from fitting."""
+    rows = [np.asarray(row, dtype=np.float64) for row in rows]
+    padded = np.full((len(rows), max((row.size for row in rows), default=0)), np.nan)
+
+    for index, row in enumerate(rows):
+        padded[index, : row.size] = row
+
+    return padded
+
+
+def compact_rows(mask: np.ndarray, *arrays: np.ndarray) -> List[np.ndarray]:
+    """Keeps the points of each row where 'mask' is True, moved to the start of
+    the row. Rows are padded with NaN to the largest number of kept points."""
+    return [pad_rows(row[keep] for row, keep in zip(array, mask)) for array in arrays]
+
+
+def fill_times(times: np.ndarray) -> np.ndarray:
+    """Replaces missing time points by tiny steps after the preceding time point
+    of their row, so that padded rows can be integrated by solvers requiring
+    strictly increasing time points."""
+    times = np.asarray(times, dtype=np.float64)
+    missing = np.isnan(times)
+    if not missing.any():
+        return times
+
+    positions = np.arange(times.shape[-1])
+    columns = np.where(missing, 0, positions)
+    np.maximum.accumulate(columns, axis=-1, out=columns)
+
+    previous = np.take_along_axis(times, columns, axis=-1)
+    steps = (positions - columns) * np.sqrt(np.finfo(float).eps)
+
+    return previous + steps * np.maximum(np.abs(previous), 1.0)
@@ -1,14 +1,26 @@
 import sdRDM
 
+import time
 import numpy as np
-from typing import Callable, List, Optional
+import pandas as pd
+from typing import Callable, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from pydantic import Field, PrivateAttr
 from sdRDM.base.listplus import ListPlus
 from sdRDM.base.utils import forge_signature, IDGenerator
 from lmfit import Parameters, minimize, report_fit
-from lmfit.minimizer import MinimizerResult
-from scipy.integrate import odeint
+from lmfit.minimizer import Minimizer, MinimizerResult
+from scipy.optimize import least_squares
+from scipy.sparse import coo_matrix
 from .kineticparameter import KineticParameter
+from .compiledmodel import CompiledModel, SPECIES
+from .finitedifference import ParallelJacobian
+from .fitcache import FitCache
+from .multistart import MultiStartSettings, draw_starting_points, select_best
+from .optimizer import compare_runs, lmfit_method
+from .ragged import fill_times
+from .resolution import ResolutionSchedule
+from .solver import SolverSettings, integrate
 from .correlation import Correlation
 from .modelresult import ModelResult
 from .kineticmodel import KineticModel
@@ -18,6 +30,30 @@ from .sboterm import SBOTerm
 from .parameter import Parameter
 from .paramtype import ParamType
 
+JACOBIANS = (None, "sensitivity", "parallel")
+# Residual of points which the ODE solver failed to reach, relative to the
+# largest substrate concentration
+FAILED_RESIDUAL = 1e3
+# Attributes of an lmfit 'MinimizerResult' which are stored in a 'FitCache' or
+# passed back from worker processes
+MINIMIZER_RESULT_ATTRIBUTES = (
+    "method",
+    "success",
+    "errorbars",
+    "message",
+    "nfev",
+    "ndata",
+    "nvarys",
+    "nfree",
+    "chisqr",
+    "redchi",
+    "aic",
+    "bic",
+    "var_names",
+    "init_vals",
+    "covar",
+)
+
 
 @forge_signature
 class ReactionSystem(sdRDM.DataModel):
@@ -50,6 +86,8 @@ class ReactionSystem(sdRDM.DataModel):
     __commit__: Optional[str] = PrivateAttr(
         default="70285185b8d9c7baf61e12dd52d943624695a510"
     )
+    _compiled_model: Optional[CompiledModel] = PrivateAttr(default=None)
+    _solver: SolverSettings = PrivateAttr(default_factory=SolverSettings)
 
     def add_to_reactions(
         self,
@@ -141,55 +179,404 @@ class ReactionSystem(sdRDM.DataModel):
 
         return parameters
 
+    @property
+    def _model_signature(self) -> tuple:
+        """Equations and parameter names the compiled model depends on."""
+        return tuple(
+            (
+                reaction.model.equation,
+                tuple(param.name for param in reaction.model.parameters),
+            )
+            for reaction in self.reactions
+        )
+
+    @property
+    def _parameter_names(self) -> List[str]:
+        return [
+            name for _, param_names in self._model_signature for name in param_names
+        ]
+
+    @property
+    def compiled_model(self) -> CompiledModel:
+        """Compiled right-hand side of the reaction system. The rate laws are only
+        re-compiled if the equations or the parameter set have changed."""
+        return self._compile(self._solver.compiler)
+
+    def _compile(self, compiler: str) -> CompiledModel:
+        signature = (self._model_signature, compiler)
+
+        if self._compiled_model is None or self._compiled_model.signature != signature:
+            self._compiled_model = CompiledModel(
+                signature=signature,
+                parameters=self._parameter_names,
+                substrate_model=self.substrate.model,
+                enzyme_model=self.enzyme.model if self.enzyme else None,
+                compiler=compiler,
+            )
+
+        return self._compiled_model
+
     def _setup_ode_model(self) -> Callable:
-        substrate_eq = self.substrate.model.function
+        return self.compiled_model.ode_model
 
-        if self.enzyme:
-            enzyme_eq = self.enzyme.model.function
-        else:
+    def simulate(
+        self,
+        times: np.ndarray,
+        init_conditions: np.ndarray,
+        params: Parameters,
+        batched: bool = True,
+        closed_form: bool = True,
+        solver: Optional[SolverSettings] = None,
+    ) -> np.ndarray:
+        """Integrates the reaction system for each pair of initial conditions and
+        time course.
+
+        Args:
+            times (np.ndarray): Time points of each replicate.
+            init_conditions (np.ndarray): Initial substrate, catalyst and product
+                concentrations of each replicate.
+            params (Parameters): Parameter values as lmfit 'Parameters' or dict.
+            batched (bool, optional): If True, all replicates sharing a time grid
+                are stacked into one ODE system and integrated in a single solver
+                call. Defaults to True.
+            closed_form (bool, optional): If True, systems following irreversible
+                Michaelis-Menten kinetics with constant catalyst are evaluated
+                with the integrated rate law instead of an ODE solver.
+                Defaults to True.
+            solver (SolverSettings, optional): Solver settings overriding the ones
+                of the reaction system. Defaults to None.
 
-            def enzyme_eq(catalyst):  # change to enzyme
-                return 0
+        Returns:
+            np.ndarray: Simulated species of shape (replicates, time points, species).
+        """
+        solver = solver or self._solver
+        compiled_model = self._compile(solver.compiler)
+        ode_model = compiled_model.ode_model
+        param_vector = compiled_model.parameter_vector(params)
+
+        if closed_form and compiled_model.closed_form:
+            init_conditions = np.atleast_2d(init_conditions)
+            times = np.broadcast_to(
+                np.atleast_2d(times), (init_conditions.shape[0], np.shape(times)[-1])
+            )
+            return self._with_closed_form(
+                compiled_model,
+                times,
+                init_conditions,
+                param_vector,
+                lambda rows: self.simulate(
+                    times[rows],
+                    init_conditions[rows],
+                    params,
+                    batched=batched,
+                    closed_form=False,
+                    solver=solver,
+                ),
+            )
 
-        def ode_model(species, time: np.ndarray, params: Parameters):
-            species_dict = dict(zip(["substrate", "catalyst", "product"], species))
+        settings = solver.resolve(self._stiffness(times, param_vector))
 
-            try:
-                params_dict = params.valuesdict()
-            except AttributeError:
-                params_dict = params
+        if settings.backend == "jax":
+            return compiled_model.jax_model(settings).simulate(
+                times, init_conditions, param_vector
+            )
 
-            combined_dict = species_dict | params_dict
+        if not batched:
+            return np.array(
+                [
+                    integrate(
+                        settings,
+                        ode_model,
+                        init_condition,
+                        time,
+                        param_vector,
+                        jacobian=compiled_model.ode_jacobian,
+                        bandwidth=compiled_model.bandwidth,
+                    )
+                    for init_condition, time in zip(init_conditions, times)
+                ]
+            )
 
-            subtrate_args = substrate_eq.__code__.co_varnames
-            substrate_dict = {k: combined_dict[k] for k in subtrate_args}
+        return self._integrate(
+            settings,
+            ode_model,
+            init_conditions,
+            times,
+            param_vector,
+            jacobian=compiled_model.ode_jacobian,
+            bandwidth=compiled_model.bandwidth,
+        )
 
-            enzyme_args = enzyme_eq.__code__.co_varnames
-            # enzyme_args = ("catalyst",)
-            enzyme_dict = {k: combined_dict[k] for k in enzyme_args}
+    def simulate_ensemble(
+        self,
+        params_matrix: np.ndarray,
+        times: np.ndarray,
+        init_conditions: np.ndarray,
+        chunk_size: Optional[int] = None,
+        closed_form: bool = True,
+        solver: Optional[SolverSettings] = None,
+    ) -> np.ndarray:
+        """Simulates the reaction system for many parameter sets in one call. All
+        replicates of all parameter sets are stacked into one ODE system, whose
+        rate laws are evaluated vectorized with one parameter set per replicate.
 
-            d_substrate = substrate_eq(**substrate_dict)
-            d_enzyme = enzyme_eq(**enzyme_dict)
+        Args:
+            params_matrix (np.ndarray): Parameter sets of shape (sets, parameters),
+                with columns ordered like the parameters of the reaction models.
+            times (np.ndarray): Time points of each replicate.
+            init_conditions (np.ndarray): Initial substrate, catalyst and product
+                concentrations of each replicate.
+            chunk_size (int, optional): Maximum number of parameter sets integrated
+                at once, which caps the peak memory. Defaults to None, integrating
+                all parameter sets at once.
+            closed_form (bool, optional): If True, irreversible Michaelis-Menten
+                systems are evaluated with the integrated rate law.
+                Defaults to True.
+            solver (SolverSettings, optional): Solver settings overriding the ones
+                of the reaction system. Defaults to None.
 
-            return np.array([d_substrate, d_enzyme, -d_substrate])
+        Returns:
+            np.ndarray: Simulated species of shape (sets, replicates, time points,
+                species).
+        """
+        solver = solver or self._solver
+        compiled_model = self._compile(solver.compiler)
 
-        return ode_model
+        params_matrix = np.atleast_2d(np.asarray(params_matrix, dtype=np.float64))
+        if params_matrix.shape[1] != len(compiled_model.parameters):
+            raise ValueError(
+                f"Parameter matrix has {params_matrix.shape[1]} columns, but the"
+                f" reaction system has parameters {list(compiled_model.parameters)}."
+            )
 
-    def simulate(
-        self, times: np.ndarray, init_conditions: np.ndarray, params: Parameters
-    ):
-        return np.array(
+        init_conditions = np.atleast_2d(init_conditions)
+        times = np.broadcast_to(
+            np.atleast_2d(times), (init_conditions.shape[0], np.shape(times)[-1])
+        )
+        settings = solver.resolve(self._stiffness(times, params_matrix.T))
+
+        n_sets = params_matrix.shape[0]
+        chunk_size = chunk_size or n_sets
+
+        return np.concatenate(
             [
-                odeint(
-                    func=self._setup_ode_model(),
-                    y0=init_condition,
-                    t=time,
-                    args=(params,),
+                self._simulate_chunk(
+                    compiled_model,
+                    settings,
+                    params_matrix[start : start + chunk_size],
+                    times,
+                    init_conditions,
+                    closed_form,
                 )
-                for init_condition, time in zip(init_conditions, times)
+                for start in range(0, n_sets, chunk_size)
             ]
         )
 
+    def _simulate_chunk(
+        self,
+        compiled_model: CompiledModel,
+        settings: SolverSettings,
+        params_matrix: np.ndarray,
+        times: np.ndarray,
+        init_conditions: np.ndarray,
+        closed_form: bool,
+    ) -> np.ndarray:
+        n_sets, n_replicates = params_matrix.shape[0], init_conditions.shape[0]
+
+        if settings.backend == "jax" and not (
+            closed_form and compiled_model.closed_form
+        ):
+            return compiled_model.jax_model(settings).simulate_ensemble(
+                times, init_conditions, params_matrix
+            )
+
+        # Rows are ordered set-major, each row carries its own parameter set
+        row_params = np.repeat(params_matrix, n_replicates, axis=0).T
+        row_times = np.tile(times, (n_sets, 1))
+        row_init_conditions = np.tile(init_conditions, (n_sets, 1))
+
+        def integrate_rows(rows):
+            return self._integrate(
+                settings,
+                compiled_model.ensemble_model,
+                row_init_conditions[rows],
+                row_times[rows],
+                row_params[:, rows],
+                jacobian=compiled_model.ensemble_jacobian,
+                bandwidth=compiled_model.bandwidth,
+            )
+
+        if closed_form and compiled_model.closed_form:
+            species = self._with_closed_form(
+                compiled_model,
+                row_times,
+                row_init_conditions,
+                row_params,
+                integrate_rows,
+            )
+        else:
+            species = integrate_rows(slice(None))
+
+        return species.reshape(n_sets, n_replicates, *species.shape[1:])
+
+    @staticmethod
+    def _with_closed_form(
+        compiled_model: CompiledModel,
+        times: np.ndarray,
+        init_conditions: np.ndarray,
+        params: np.ndarray,
+        integrate_rows: Callable[[np.ndarray], np.ndarray],
+    ) -> np.ndarray:
+        """Evaluates replicates with the integrated Michaelis-Menten rate law if
+        their initial substrate is positive, since it takes its logarithm. Other
+        replicates, such as blanks, are integrated with 'integrate_rows', which
+        receives a mask of their rows."""
+        closed = init_conditions[:, 0] > 0
+        species = np.empty((*times.shape, init_conditions.shape[1]))
+
+        if closed.any():
+            species[closed] = compiled_model.integrated_michaelis_menten(
+                times[closed],
+                init_conditions[closed],
+                params[:, closed] if params.ndim == 2 else params,
+            )
+        if not closed.all():
+            species[~closed] = integrate_rows(~closed)
+
+        return species
+
+    def simulate_sensitivities(
+        self,
+        times: np.ndarray,
+        init_conditions: np.ndarray,
+        params: Parameters,
+        solver: Optional[SolverSettings] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Integrates the reaction system together with its forward sensitivities.
+        With the 'jax' backend, the sensitivity system is derived by automatic
+        differentiation of the rate laws and integrated with JAX.
+
+        Args:
+            times (np.ndarray): Time points of each replicate.
+            init_conditions (np.ndarray): Initial substrate, catalyst and product
+                concentrations of each replicate.
+            params (Parameters): Parameter values as lmfit 'Parameters' or dict.
+            solver (SolverSettings, optional): Solver settings overriding the ones
+                of the reaction system. Defaults to None.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Simulated species of shape (replicates,
+                time points, species) and their derivatives with respect to the
+                parameters of shape (replicates, time points, species, parameters).
+        """
+        solver = solver or self._solver
+        compiled_model = self._compile(solver.compiler)
+        param_vector = compiled_model.parameter_vector(params)
+        settings = solver.resolve(self._stiffness(times, param_vector))
+
+        if settings.backend == "jax":
+            jax_model = compiled_model.jax_model(settings)
+            return (
+                jax_model.simulate(times, init_conditions, param_vector),
+                jax_model.sensitivities(times, init_conditions, param_vector),
+            )
+
+        init_conditions = np.atleast_2d(init_conditions)
+        n_species = init_conditions.shape[1]
+        block_size = compiled_model.sensitivity_block_size
+
+        augmented = np.zeros((init_conditions.shape[0], block_size))
+        augmented[:, :n_species] = init_conditions
+
+        solution = self._integrate(
+            settings,
+            compiled_model.sensitivity_model,
+            augmented,
+            times,
+            param_vector,
+            bandwidth=block_size - 1,
+        )
+
+        return (
+            solution[:, :, :n_species],
+            solution[:, :, n_species:].reshape(
+                *solution.shape[:2], n_species, len(compiled_model.parameters)
+            ),
+        )
+
+    @staticmethod
+    def _integrate(
+        settings: SolverSettings,
+        func: Callable,
+        init_conditions: np.ndarray,
+        times: np.ndarray,
+        param_vector: np.ndarray,
+        jacobian: Optional[Callable] = None,
+        bandwidth: Optional[int] = None,
+    ) -> np.ndarray:
+        """Stacks all replicates sharing a time grid into one system and
+        integrates it with a single solver call. A parameter matrix of shape
+        (parameters, replicates) is split along with the replicates.
+
+        Replicates with identical initial conditions, time grid and parameters
+        are integrated once and their solution is copied to all of them."""
+        times = np.atleast_2d(times)
+        init_conditions = np.atleast_2d(init_conditions)
+        n_states = init_conditions.shape[1]
+
+        row_keys = [init_conditions, times]
+        if param_vector.ndim == 2:
+            row_keys.append(param_vector.T)
+        _, unique_rows, duplicates = np.unique(
+            np.hstack(row_keys), axis=0, return_index=True, return_inverse=True
+        )
+
+        if unique_rows.size < times.shape[0]:
+            return ReactionSystem._integrate(
+                settings,
+                func,
+                init_conditions[unique_rows],
+                times[unique_rows],
+                (
+                    param_vector[:, unique_rows]
+                    if param_vector.ndim == 2
+                    else param_vector
+                ),
+                jacobian=jacobian,
+                bandwidth=bandwidth,
+            )[duplicates.ravel()]
+
+        grids, grid_ids = np.unique(times, axis=0, return_inverse=True)
+        grid_ids = grid_ids.ravel()
+
+        solution = np.empty((times.shape[0], times.shape[1], n_states))
+        for grid_id, time in enumerate(grids):
+            rows = np.flatnonzero(grid_ids == grid_id)
+            stacked = integrate(
+                settings,
+                func,
+                init_conditions[rows].ravel(),
+                time,
+                param_vector[:, rows] if param_vector.ndim == 2 else param_vector,
+                jacobian=jacobian,
+                bandwidth=bandwidth,
+            )
+            solution[rows] = stacked.reshape(len(time), len(rows), n_states).transpose(
+                1, 0, 2
+            )
+
+        return solution
+
+    def _stiffness(self, times: np.ndarray, param_vector: np.ndarray) -> float:
+        """Ratio of the observation window to the time scale of enzyme inactivation."""
+        parameters = self._parameter_names
+        if ParamType.K_IE.value not in parameters:
+            return 0.0
+
+        k_ie = param_vector[parameters.index(ParamType.K_IE.value)]
+
+        return np.max(np.abs(k_ie)) * (np.max(times) - np.min(times))
+
     def residuals(
         self,
         params: Parameters,
@@ -200,7 +587,36 @@ class ReactionSystem(sdRDM.DataModel):
         model_data = self.simulate(times, init_conditions, params)
         residuals = model_data[:, :, 0] - subtrate_data  # fitting to substrate data
 
-        return residuals.flatten()
+        # Missing and padded points are NaN and do not contribute
+        residuals = residuals[np.isfinite(subtrate_data)]
+
+        # Points a failed integration did not reach get a large finite residual,
+        # so that optimizers reject the trial point instead of aborting the fit
+        penalty = FAILED_RESIDUAL * max(np.nanmax(np.abs(subtrate_data)), 1.0)
+
+        return np.where(np.isfinite(residuals), residuals, penalty)
+
+    def residual_jacobian(
+        self,
+        params: Parameters,
+        times: np.ndarray,
+        init_conditions: np.ndarray,
+        subtrate_data: np.ndarray,
+    ) -> np.ndarray:
+        """Jacobian of 'residuals' with respect to the varied parameters, obtained
+        from the forward sensitivities of the substrate."""
+        _, sensitivities = self.simulate_sensitivities(times, init_conditions, params)
+
+        var_ids = [
+            self._parameter_names.index(name)
+            for name, param in params.items()
+            if param.vary
+        ]
+
+        jacobian = sensitivities[:, :, 0, var_ids][np.isfinite(subtrate_data)]
+
+        # The penalty of points a failed integration did not reach is constant
+        return np.nan_to_num(jacobian, nan=0.0, posinf=0.0, neginf=0.0)
 
     def _get_init_conditions(
         self,
@@ -210,6 +626,30 @@ class ReactionSystem(sdRDM.DataModel):
     ) -> np.ndarray:
         return np.array([substrate_data[:, 0], enzyme_data[:, 0], product_data[:, 0]]).T
 
+    def _fit_args(
+        self,
+        substrate_data: np.ndarray,
+        enzyme_data: np.ndarray,
+        product_data: np.ndarray,
+        times: np.ndarray,
+    ) -> tuple:
+        """Arguments of 'residuals' for data which may hold missing points or be
+        padded to a common length with NaN. Missing time points are filled for the
+        integration, and their substrate data is masked. The first point of each
+        replicate holds its initial conditions and has to be valid."""
+        substrate_data = np.where(np.isnan(times), np.nan, substrate_data)
+        init_conditions = self._get_init_conditions(
+            substrate_data=substrate_data,
+            enzyme_data=enzyme_data,
+            product_data=product_data,
+        )
+        if np.isnan(init_conditions).any():
+            raise ValueError(
+                "The first point of each replicate must hold valid initial conditions."
+            )
+
+        return fill_times(times), init_conditions, substrate_data
+
     def fit(
         self,
         substrate_data: np.ndarray,
@@ -217,28 +657,598 @@ class ReactionSystem(sdRDM.DataModel):
         product_data: np.ndarray,
         times: np.ndarray,
         fixed_params: List[str] = [],
+        jacobian: Optional[str] = None,
+        solver: Optional[SolverSettings] = None,
+        multistart: Optional[MultiStartSettings] = None,
+        cache: Optional[FitCache] = None,
+        optimizer: str = "leastsq",
+        max_nfev: int = 300,
+        schedule: Optional[ResolutionSchedule] = None,
     ):
+        """Fits the parameters of the reaction system to the substrate data.
+
+        Args:
+            substrate_data (np.ndarray): Substrate concentrations of each replicate.
+            enzyme_data (np.ndarray): Enzyme concentrations of each replicate.
+            product_data (np.ndarray): Product concentrations of each replicate.
+            times (np.ndarray): Time points of each replicate.
+            fixed_params (List[str], optional): Parameters which are not varied.
+                Defaults to [].
+            jacobian (str, optional): If 'sensitivity', the Jacobian of the
+                residuals is computed from the forward sensitivity equations instead
+                of finite differences, or by automatic differentiation with the
+                'jax' solver backend. If 'parallel', the finite differences of
+                all parameters are computed concurrently in worker processes.
+                Only supported by the 'leastsq' optimizer. Defaults to None.
+            solver (SolverSettings, optional): Settings of the ODE solver, which are
+                kept by the reaction system for later simulations. Defaults to None.
+            multistart (MultiStartSettings, optional): If given, the system is
+                fitted from several starting points within the parameter bounds
+                and the best solution is kept. Defaults to None.
+            cache (FitCache, optional): Cache of fit results. If a fit of the same
+                data, model, parameter setup and settings is cached, its result
+                is restored instead of fitting and the returned 'MinimizerResult'
+                is rebuilt from the cache. Defaults to None.
+            optimizer (str, optional): 'leastsq' (Levenberg-Marquardt), 'trf' or
+                'dogbox' (trust-region least squares with Jacobian scaling),
+                'lbfgsb' (bounded L-BFGS on the sum of squares) or 'nelder'
+                (Nelder-Mead). Defaults to 'leastsq'.
+            max_nfev (int, optional): Maximum number of function evaluations.
+                Defaults to 300.
+            schedule (ResolutionSchedule, optional): If given, the system is fitted
+                coarse-to-fine on progressively denser subsets of the time points.
+                Multi-start fitting is done on the coarsest stage and 'max_nfev'
+                applies per stage. The wall time of each stage is reported in
+                'result.stage_times'. Defaults to None.
+        """
+        self._check_fit_options(jacobian, optimizer)
+
+        if solver is not None:
+            self._solver = solver
+
+        if cache is not None:
+            key = FitCache.key(
+                substrate_data,
+                enzyme_data,
+                product_data,
+                times,
+                self._fit_setup(fixed_params),
+                jacobian,
+                self._solver,
+                multistart,
+                optimizer,
+                max_nfev,
+                schedule,
+            )
+            entry = cache.get(key)
+            if entry is not None:
+                return self._restore_fit(entry)
+
         params = self._create_lmfit_params(fixed_params=fixed_params)
 
-        init_conditions = self._get_init_conditions(
-            substrate_data=substrate_data,
-            enzyme_data=enzyme_data,
-            product_data=product_data,
+        data = (substrate_data, enzyme_data, product_data, times)
+        stages = schedule.stages(*data) if schedule is not None else [data]
+        stage_times = []
+
+        for stage, (substrate, enzyme, product, time_points) in enumerate(stages):
+            start_time = time.perf_counter()
+
+            args = self._fit_args(substrate, enzyme, product, time_points)
+
+            if multistart is None or stage > 0:
+                lmfit_result = self._minimize(
+                    params, args, jacobian, max_nfev=max_nfev, optimizer=optimizer
+                )
+            else:
+                lmfit_result, n_converged = self._minimize_multistart(
+                    params, args, jacobian, multistart, max_nfev, optimizer
+                )
+
+            # The next stage starts from the estimates of this stage
+            params = lmfit_result.params
+            stage_times.append(time.perf_counter() - start_time)
+
+        self._update_param_values(lmfit_result, fixed_params=fixed_params)
+        self._update_fit_statistics(lmfit_result, fixed_params=fixed_params)
+
+        if multistart is not None:
+            self.result.n_starts = multistart.n_starts
+            self.result.n_converged = n_converged
+
+        if schedule is not None:
+            self.result.stage_times = stage_times
+
+        if cache is not None:
+            cache.put(key, self._fit_entry(lmfit_result))
+
+        return lmfit_result
+
+    def _fit_setup(self, fixed_params: List[str]) -> list:
+        """Equations and parameter setup a fit depends on."""
+        return [
+            (
+                reaction.model.equation,
+                [
+                    (
+                        param.name,
+                        param.initial_value,
+                        param.lower,
+                        param.upper,
+                        param.value if param.name in fixed_params else None,
+                    )
+                    for param in reaction.model.parameters
+                ],
+            )
+            for reaction in self.reactions
+        ]
+
+    def _fit_entry(self, lmfit_result: MinimizerResult) -> dict:
+        """Fitted parameters and fit statistics as stored in a 'FitCache'."""
+        return dict(
+            parameters={
+                param.name: [param.value, param.stdev]
+                for reaction in self.reactions
+                for param in reaction.model.parameters
+            },
+            result=self.result.to_dict(),
+            minimizer=_minimizer_state(lmfit_result),
         )
 
-        lmfit_result = minimize(
+    def _restore_fit(self, entry: dict) -> MinimizerResult:
+        """Restores a cached fit and rebuilds the result of the minimizer."""
+        for reaction in self.reactions:
+            for param in reaction.model.parameters:
+                param.value, param.stdev = entry["parameters"][param.name]
+
+        self.result = ModelResult(**entry["result"])
+
+        return _minimizer_result(entry["minimizer"])
+
+    def partial_fit(
+        self,
+        substrate_data: np.ndarray,
+        enzyme_data: np.ndarray,
+        product_data: np.ndarray,
+        times: np.ndarray,
+        max_nfev: int,
+        fixed_params: List[str] = [],
+        jacobian: Optional[str] = None,
+        solver: Optional[SolverSettings] = None,
+        optimizer: str = "leastsq",
+    ) -> float:
+        """Fits the parameters with a budget of 'max_nfev' function evaluations,
+        starting from their initial values. The best point found becomes the new
+        initial values, so that repeated calls continue the fit.
+
+        Args:
+            substrate_data (np.ndarray): Substrate concentrations of each replicate.
+            enzyme_data (np.ndarray): Enzyme concentrations of each replicate.
+            product_data (np.ndarray): Product concentrations of each replicate.
+            times (np.ndarray): Time points of each replicate.
+            max_nfev (int): Maximum number of function evaluations.
+            fixed_params (List[str], optional): Parameters which are not varied.
+                Defaults to [].
+            jacobian (str, optional): See 'fit'. Defaults to None.
+            solver (SolverSettings, optional): See 'fit'. Defaults to None.
+            optimizer (str, optional): See 'fit'. Defaults to 'leastsq'.
+
+        Returns:
+            float: Akaike information criterion of the best point found.
+        """
+        self._check_fit_options(jacobian, optimizer)
+
+        if solver is not None:
+            self._solver = solver
+
+        params = self._create_lmfit_params(fixed_params=fixed_params)
+
+        args = self._fit_args(substrate_data, enzyme_data, product_data, times)
+
+        best = dict(chisqr=np.inf, values=None, ndata=1)
+
+        def track_best(params, iteration, residual, *args):
+            chisqr = np.sum(residual**2)
+            if chisqr < best["chisqr"]:
+                best.update(
+                    chisqr=chisqr, values=params.valuesdict(), ndata=residual.size
+                )
+
+        self._minimize(
+            params,
+            args,
+            jacobian,
+            max_nfev=max_nfev,
+            iter_cb=track_best,
+            optimizer=optimizer,
+        )
+
+        if best["values"] is None or not np.isfinite(best["chisqr"]):
+            return float("inf")
+
+        for reaction in self.reactions:
+            for param in reaction.model.parameters:
+                if params[param.name].vary:
+                    param.initial_value = best["values"][param.name]
+
+        # Same definition as lmfit
+        n_varys = sum(param.vary for param in params.values())
+        ndata = best["ndata"]
+        neg2_log_likelihood = ndata * np.log(max(best["chisqr"], 1e-250) / ndata)
+
+        return neg2_log_likelihood + 2 * n_varys
+
+    def _prune(self, partial_aic: float):
+        """Marks the reaction system as pruned in a model tournament."""
+        self.result.fit_success = False
+        self.result.pruned = True
+        self.result.AIC = partial_aic
+
+    @staticmethod
+    def _check_fit_options(jacobian: Optional[str], optimizer: str):
+        if jacobian not in JACOBIANS:
+            raise ValueError(f"Unknown jacobian '{jacobian}'. Use one of {JACOBIANS}.")
+
+        # lmfit only passes a Jacobian ('Dfun') on to 'least_squares' from
+        # version 1.3 on, so it is restricted to Levenberg-Marquardt
+        lmfit_method(optimizer)
+        if jacobian is not None and optimizer != "leastsq":
+            raise ValueError(
+                f"Jacobian '{jacobian}' is only supported by the 'leastsq' optimizer."
+            )
+
+    def _minimize(
+        self,
+        params: Parameters,
+        args: tuple,
+        jacobian: Optional[str] = None,
+        deadline: Optional[float] = None,
+        max_nfev: int = 300,
+        iter_cb: Optional[Callable] = None,
+        optimizer: str = "leastsq",
+    ) -> Optional[MinimizerResult]:
+        """Runs the fit with the given optimizer. A fit reaching the 'deadline'
+        (as given by 'time.time') is aborted, a fit starting after it is skipped."""
+        if deadline is not None and time.time() > deadline:
+            return None
+
+        def callback(params, iteration, residual, *args):
+            if iter_cb is not None:
+                iter_cb(params, iteration, residual, *args)
+
+            return deadline is not None and time.time() > deadline
+
+        method, fit_kws = lmfit_method(optimizer)
+        parallel_jacobian = None
+        if jacobian == "sensitivity":
+            fit_kws["Dfun"] = self.residual_jacobian
+        elif jacobian == "parallel":
+            parallel_jacobian = ParallelJacobian(self.to_dict(), self._solver, args)
+            fit_kws["Dfun"] = parallel_jacobian
+
+        # Solver keywords are passed through the Minimizer, since 'minimize'
+        # reserves the 'method' keyword of 'least_squares'
+        minimizer = Minimizer(
             self.residuals,
             params,
-            args=(times, init_conditions, substrate_data),
-            method="leastsq",
-            max_nfev=300,
+            fcn_args=args,
+            iter_cb=callback,
+            max_nfev=max_nfev,
+            **fit_kws,
         )
 
+        try:
+            result = minimizer.minimize(method=method)
+        finally:
+            if parallel_jacobian is not None:
+                parallel_jacobian.close()
+
+        # Penalized points hide a failed integration from the optimizer
+        times, init_conditions, _ = args
+        if not np.isfinite(self.simulate(times, init_conditions, result.params)).all():
+            result.success = False
+            result.message = "Integration failed at the final parameter values."
+
+        return result
+
+    def _minimize_multistart(
+        self,
+        params: Parameters,
+        args: tuple,
+        jacobian: Optional[str],
+        settings: MultiStartSettings,
+        max_nfev: int = 300,
+        optimizer: str = "leastsq",
+    ) -> Tuple[MinimizerResult, int]:
+        """Fits all starting points and returns the best fit together with the
+        number of starts which converged to it."""
+        starts = draw_starting_points(params, settings)
+        deadline = time.time() + settings.timeout if settings.timeout else None
+
+        if settings.n_jobs is None or settings.n_jobs <= 1:
+            results = [
+                self._minimize(
+                    start, args, jacobian, deadline, max_nfev, None, optimizer
+                )
+                for start in starts
+            ]
+        else:
+            system = self.to_dict()
+            with ProcessPoolExecutor(max_workers=settings.n_jobs) as pool:
+                futures = [
+                    pool.submit(
+                        _minimize_start,
+                        system,
+                        self._solver,
+                        start,
+                        args,
+                        jacobian,
+                        deadline,
+                        max_nfev,
+                        optimizer,
+                    )
+                    for start in starts
+                ]
+                results = [
+                    None if state is None else _minimizer_result(state)
+                    for state in (future.result() for future in futures)
+                ]
+
+        lmfit_result, n_converged = select_best(results, rtol=settings.rtol)
+        if lmfit_result is None:
+            raise TimeoutError(
+                f"No fit of '{self.name}' finished within {settings.timeout} s."
+            )
+
+        return lmfit_result, n_converged
+
+    def compare_optimizers(
+        self,
+        substrate_data: np.ndarray,
+        enzyme_data: np.ndarray,
+        product_data: np.ndarray,
+        times: np.ndarray,
+        optimizers: Tuple[str, ...] = ("leastsq", "trf", "dogbox", "lbfgsb", "nelder"),
+        fixed_params: List[str] = [],
+        max_nfev: int = 300,
+    ) -> pd.DataFrame:
+        """Fits copies of the reaction system with several optimizers on the same
+        data. The reaction system itself is not modified.
+
+        Args:
+            substrate_data (np.ndarray): Substrate concentrations of each replicate.
+            enzyme_data (np.ndarray): Enzyme concentrations of each replicate.
+            product_data (np.ndarray): Product concentrations of each replicate.
+            times (np.ndarray): Time points of each replicate.
+            optimizers (Tuple[str, ...], optional): Optimizers to compare, see
+                'fit'. Defaults to all optimizers.
+            fixed_params (List[str], optional): Parameters which are not varied.
+                Defaults to [].
+            max_nfev (int, optional): Maximum number of function evaluations per
+                optimizer. Defaults to 300.
+
+        Returns:
+            pd.DataFrame: Wall time, number of function evaluations, final sum of
+                squared errors, success and maximum relative deviation of the
+                parameters from the best run for each optimizer.
+        """
+        args = self._fit_args(substrate_data, enzyme_data, product_data, times)
+
+        runs = []
+        for optimizer in optimizers:
+            system = ReactionSystem(**self.to_dict())
+            system._solver = self._solver
+            system._compiled_model = self.compiled_model
+
+            start = time.perf_counter()
+            result = system.fit(
+                substrate_data=substrate_data,
+                enzyme_data=enzyme_data,
+                product_data=product_data,
+                times=times,
+                fixed_params=fixed_params,
+                optimizer=optimizer,
+                max_nfev=max_nfev,
+            )
+            wall_time = time.perf_counter() - start
+
+            residuals = system.residuals(result.params, *args)
+            runs.append(
+                dict(
+                    optimizer=optimizer,
+                    wall_time=wall_time,
+                    nfev=result.nfev,
+                    sse=np.sum(residuals**2),
+                    success=result.success,
+                    params={
+                        name: param.value
+                        for name, param in result.params.items()
+                        if param.vary
+                    },
+                )
+            )
+
+        return compare_runs(runs)
+
+    def fit_nuisance(
+        self,
+        substrate_data: np.ndarray,
+        enzyme_data: np.ndarray,
+        product_data: np.ndarray,
+        times: np.ndarray,
+        species: str = "catalyst",
+        groups: Optional[np.ndarray] = None,
+        bounds: Tuple[float, float] = (0.5, 1.5),
+        prior_weight: float = 0.0,
+        fixed_params: List[str] = [],
+        solver: Optional[SolverSettings] = None,
+        max_nfev: int = 300,
+    ) -> MinimizerResult:
+        """Fits the kinetic parameters together with a loading factor per group of
+        replicates, which scales the initial concentration of 'species'. This
+        accounts for pipetting errors of individual wells.
+
+        The residuals of a group only depend on the kinetic parameters and the
+        group's own loading factor. This block structure is passed to the
+        trust-region solver of 'scipy.optimize.least_squares' as Jacobian sparsity,
+        so all loading factors share one finite-difference evaluation and the
+        cost grows linearly with the number of groups.
+
+        Args:
+            substrate_data (np.ndarray): Substrate concentrations of each replicate.
+            enzyme_data (np.ndarray): Enzyme concentrations of each replicate.
+            product_data (np.ndarray): Product concentrations of each replicate.
+            times (np.ndarray): Time points of each replicate.
+            species (str, optional): Species whose initial concentration is
+                scaled, one of 'substrate', 'catalyst' and 'product'.
+                Defaults to 'catalyst'.
+            groups (np.ndarray, optional): Group label of each replicate, such as
+                the measurement or well it belongs to. Defaults to None, giving
+                each replicate its own loading factor.
+            bounds (Tuple[float, float], optional): Bounds of the loading factors.
+                Defaults to (0.5, 1.5).
+            prior_weight (float, optional): Weight of additional residuals
+                'prior_weight * (factor - 1)', which pull each loading factor
+                towards 1. A sensible weight is the noise level of the data
+                divided by the expected relative loading error. Catalyst loading
+                is only identifiable relative to k_cat and requires a positive
+                weight. Defaults to 0.
+            fixed_params (List[str], optional): Parameters which are not varied.
+                Defaults to [].
+            solver (SolverSettings, optional): Settings of the ODE solver, which are
+                kept by the reaction system for later simulations. Defaults to None.
+            max_nfev (int, optional): Maximum number of function evaluations.
+                Defaults to 300.
+
+        Returns:
+            MinimizerResult: Fit result, whose 'nuisance' attribute holds the
+                loading factor of each group in the order of the sorted labels.
+        """
+        if species not in SPECIES:
+            raise ValueError(f"Unknown species '{species}'. Use one of {SPECIES}.")
+
+        if solver is not None:
+            self._solver = solver
+
+        params = self._create_lmfit_params(fixed_params=fixed_params)
+
+        times, init_conditions, substrate_data = self._fit_args(
+            substrate_data, enzyme_data, product_data, times
+        )
+        n_replicates = substrate_data.shape[0]
+
+        if groups is None:
+            groups = np.arange(n_replicates)
+        _, groups = np.unique(np.asarray(groups), return_inverse=True)
+        groups = groups.ravel()
+        n_groups = groups.max() + 1
+
+        names = [name for name, param in params.items() if param.vary]
+        n_globals = len(names)
+        values = params.valuesdict()
+        species_id = SPECIES.index(species)
+
+        def residuals(x: np.ndarray) -> np.ndarray:
+            values.update(zip(names, x[:n_globals]))
+            factors = x[n_globals:]
+            loaded = init_conditions.copy()
+            loaded[:, species_id] *= factors[groups]
+
+            return np.concatenate(
+                [
+                    self.residuals(values, times, loaded, substrate_data),
+                    prior_weight * (factors - 1),
+                ]
+            )
+
+        # Every data residual depends on the globals and on the factor of its
+        # group, every prior residual only on its factor
+        valid = np.isfinite(substrate_data)
+        rows = np.arange(np.count_nonzero(valid))
+        row_groups = np.broadcast_to(groups[:, None], valid.shape)[valid]
+        priors = np.arange(n_groups)
+        sparsity = coo_matrix(
+            (
+                np.ones(rows.size * (n_globals + 1) + n_groups),
+                (
+                    np.concatenate(
+                        [np.repeat(rows, n_globals), rows, rows.size + priors]
+                    ),
+                    np.concatenate(
+                        [
+                            np.tile(np.arange(n_globals), rows.size),
+                            n_globals + row_groups,
+                            n_globals + priors,
+                        ]
+                    ),
+                ),
+            ),
+            shape=(rows.size + n_groups, n_globals + n_groups),
+        ).tocsr()
+
+        result = least_squares(
+            residuals,
+            x0=np.concatenate(
+                [[params[name].value for name in names], np.ones(n_groups)]
+            ),
+            jac_sparsity=sparsity,
+            bounds=(
+                [params[name].min for name in names] + [bounds[0]] * n_groups,
+                [params[name].max for name in names] + [bounds[1]] * n_groups,
+            ),
+            method="trf",
+            x_scale="jac",
+            max_nfev=max_nfev,
+        )
+
+        lmfit_result = self._nuisance_statistics(result, params, names, rows.size)
         self._update_param_values(lmfit_result, fixed_params=fixed_params)
         self._update_fit_statistics(lmfit_result, fixed_params=fixed_params)
 
         return lmfit_result
 
+    @staticmethod
+    def _nuisance_statistics(
+        result, params: Parameters, names: List[str], n_data: int
+    ) -> MinimizerResult:
+        """Converts a 'least_squares' result to an lmfit result, with standard
+        errors and correlations of the kinetic parameters from the Jacobian. The
+        information criteria only account for the first 'n_data' residuals."""
+        n_varys = result.x.size
+        chisqr = max(np.sum(result.fun[:n_data] ** 2), 1e-250)
+        neg2_log_likelihood = n_data * np.log(chisqr / n_data)
+
+        params = params.copy()
+        for name, value in zip(names, result.x):
+            params[name].value = value
+
+        jacobian = result.jac
+        hessian = jacobian.T @ jacobian
+        hessian = hessian.toarray() if hasattr(hessian, "toarray") else hessian
+        covariance = np.linalg.pinv(hessian) * chisqr / max(n_data - n_varys, 1)
+        stderr = np.sqrt(np.abs(np.diag(covariance)))
+
+        for i, name in enumerate(names):
+            params[name].stderr = stderr[i]
+            params[name].correl = {
+                other: covariance[i, j] / (stderr[i] * stderr[j])
+                for j, other in enumerate(names)
+                if j != i and stderr[i] > 0 and stderr[j] > 0
+            }
+
+        return MinimizerResult(
+            method="least_squares",
+            params=params,
+            success=result.success,
+            message=result.message,
+            nfev=result.nfev,
+            ndata=n_data,
+            nvarys=n_varys,
+            chisqr=chisqr,
+            aic=neg2_log_likelihood + 2 * n_varys,
+            bic=neg2_log_likelihood + np.log(n_data) * n_varys,
+            nuisance=result.x[len(names) :],
+        )
+
     def get_parameter(self, param_name: str) -> KineticParameter:
         for reaction in self.reactions:
             return reaction.model.get_parameter(param_name)
@@ -277,6 +1287,17 @@ class ReactionSystem(sdRDM.DataModel):
                     )
                 )
 
+    def _apply_fit(self, fitted: "ReactionSystem"):
+        """Takes over parameter estimates and fit statistics of a fitted copy."""
+        for reaction, fitted_reaction in zip(self.reactions, fitted.reactions):
+            for param, fitted_param in zip(
+                reaction.model.parameters, fitted_reaction.model.parameters
+            ):
+                param.value = fitted_param.value
+                param.stdev = fitted_param.stdev
+
+        self.result = fitted.result
+
     @property
     def fitted_params_dict(self):
         params = {}
@@ -322,3 +1343,49 @@ class ReactionSystem(sdRDM.DataModel):
         unit = unit.replace("umol", "µmol")
         unit = unit.replace("ug", "µg")
         return unit
+
+
+def _minimize_start(
+    system: dict,
+    solver: SolverSettings,
+    params: Parameters,
+    args: tuple,
+    jacobian: Optional[str],
+    deadline: Optional[float],
+    max_nfev: int,
+    optimizer: str,
+) -> Optional[dict]:
+    """Fits one starting point of a reaction system in a worker process. The
+    result is returned as plain data, since the minimizer result references the
+    residual functions of the worker."""
+    reaction_system = ReactionSystem(**system)
+    reaction_system._solver = solver
+
+    lmfit_result = reaction_system._minimize(
+        params, args, jacobian, deadline, max_nfev, optimizer=optimizer
+    )
+    if lmfit_result is None:
+        return None
+
+    return _minimizer_state(lmfit_result)
+
+
+def _minimizer_state(lmfit_result: MinimizerResult) -> dict:
+    """Attributes of a minimizer result as JSON-serializable data."""
+    state = {
+        name: getattr(lmfit_result, name, None) for name in MINIMIZER_RESULT_ATTRIBUTES
+    }
+    if state["covar"] is not None:
+        state["covar"] = np.asarray(state["covar"]).tolist()
+
+    return dict(state, params=lmfit_result.params.dumps())
+
+
+def _minimizer_result(state: dict) -> MinimizerResult:
+    """Rebuilds a minimizer result from its attributes."""
+    state = dict(state)
+    if state["covar"] is not None:
+        state["covar"] = np.array(state["covar"])
+    state["params"] = Parameters().loads(state["params"])
+
+    return MinimizerResult(**state)
@@ -1,4 +1,5 @@
 import sdRDM
+import numpy as np
 
 from typing import Optional, Union, List
 from pydantic import PrivateAttr, Field, validator
@@ -6,6 +7,7 @@ from sdRDM.base.listplus import ListPlus
 from sdRDM.base.utils import forge_signature, IDGenerator
 from .abstractspecies import AbstractSpecies
 from .datatypes import DataTypes
+from .floatarray import FloatArray, arrays_to_lists
 
 
 @forge_signature
@@ -46,16 +48,16 @@ class Replicate(sdRDM.DataModel):
         description="Time unit of the replicate.",
     )
 
-    time: List[float] = Field(
+    time: FloatArray = Field(
         multiple=True,
         description="Time steps of the replicate.",
-        default_factory=ListPlus,
+        default_factory=FloatArray.empty,
     )
 
-    data: List[float] = Field(
+    data: FloatArray = Field(
         multiple=True,
         description="Data that was measured.",
-        default_factory=ListPlus,
+        default_factory=FloatArray.empty,
     )
 
     is_calculated: bool = Field(
@@ -79,6 +81,16 @@ class Replicate(sdRDM.DataModel):
         default="70285185b8d9c7baf61e12dd52d943624695a510"
     )
 
+    class Config:
+        json_encoders = {np.ndarray: lambda array: array.tolist()}
+
+    def dict(self, *args, **kwargs) -> dict:
+        """Exports time and data as lists, also when nested in other models."""
+        return arrays_to_lists(super().dict(*args, **kwargs))
+
+    def to_dict(self, *args, **kwargs) -> dict:
+        return arrays_to_lists(super().to_dict(*args, **kwargs))
+
     @validator("species_id")
     def get_species_id_reference(cls, value):
         """Extracts the ID from a given object to create a reference"""
@@ -0,0 +1,67 @@
+import numpy as np
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+COARSENINGS = ("stride", "bin")
+
+
+@dataclass
+class ResolutionSchedule:
+    """Schedule of a coarse-to-fine fit, where a reaction system is first fitted
+    to a coarse subset of the time points and then refined on denser grids, each
+    stage starting from the estimates of the previous one.
+
+    Attributes:
+        strides (Tuple[int, ...]): Number of time points combined into one point
+            per stage, from coarse to fine. The last stage has to be 1, so that the
+            final estimates and fit statistics refer to all data.
+            Defaults to (16, 4, 1).
+        coarsening (str): 'stride' keeps every n-th time point, 'bin' averages
+            bins of n consecutive time points. The first time point of each
+            replicate is always kept, since it holds the initial conditions.
+            Defaults to 'stride'.
+        min_points (int): Coarse stages with fewer time points per replicate are
+            skipped. Defaults to 8.
+    """
+
+    strides: Tuple[int, ...] = (16, 4, 1)
+    coarsening: str = "stride"
+    min_points: int = 8
+
+    def __post_init__(self):
+        if self.coarsening not in COARSENINGS:
+            raise ValueError(
+                f"Unknown coarsening '{self.coarsening}'. Use one of {COARSENINGS}."
+            )
+        if not self.strides or self.strides[-1] != 1:
+            raise ValueError("The last stage has to fit all time points.")
+        if any(stride < 1 for stride in self.strides):
+            raise ValueError("Strides have to be positive integers.")
+
+    def stages(self, *arrays: np.ndarray) -> List[Tuple[np.ndarray, ...]]:
+        """Coarsened copies of 'arrays' of shape (replicates, time points), one
+        tuple per stage which is not skipped."""
+        stages = []
+        for stride in self.strides:
+            stage = tuple(self._coarsen(array, stride) for array in arrays)
+            if stride == 1 or stage[0].shape[1] >= self.min_points:
+                stages.append(stage)
+
+        return stages
+
+    def _coarsen(self, array: np.ndarray, stride: int) -> np.ndarray:
+        if stride == 1:
+            return array
+
+        if self.coarsening == "stride":
+            return array[:, ::stride]
+
+        starts = np.arange(1, array.shape[1], stride)
+        if not starts.size:
+            return array
+
+        counts = np.diff(np.append(starts, array.shape[1]))
+        bins = np.add.reduceat(array[:, 1:], starts - 1, axis=1) / counts
+
+        return np.column_stack([array[:, 0], bins])
@@ -0,0 +1,183 @@
+import warnings
+import numpy as np
+
+from dataclasses import dataclass, replace
+from typing import Callable, Optional
+from scipy.integrate import BDF, LSODA, RK45, Radau, odeint
+from scipy.sparse import dia_matrix
+
+BACKENDS = ("odeint", "solve_ivp", "jax", "auto")
+METHODS = ("LSODA", "BDF", "Radau", "RK45")
+SOLVERS = dict(LSODA=LSODA, BDF=BDF, Radau=Radau, RK45=RK45)
+STIFF_METHODS = ("LSODA", "BDF", "Radau")
+COMPILERS = ("numpy", "numba")
+
+
+@dataclass
+class SolverSettings:
+    """Settings of the ODE solver used to integrate reaction systems.
+
+    Attributes:
+        backend (str): 'odeint', 'solve_ivp', 'jax' or 'auto'. In 'auto' mode,
+            'odeint' is used unless the system is stiff, in which case 'solve_ivp'
+            with `stiff_method` is used. The 'jax' backend integrates all
+            replicates with one jitted Dormand-Prince kernel and provides
+            sensitivities by automatic differentiation. It requires JAX with
+            64-bit precision enabled through
+            `jax.config.update('jax_enable_x64', True)`. Defaults to 'odeint'.
+        method (str): Integration method of 'solve_ivp', one of 'LSODA', 'BDF',
+            'Radau' or 'RK45'. Defaults to 'LSODA'.
+        rtol (float): Relative tolerance. Defaults to the 'odeint' default.
+        atol (float): Absolute tolerance. Defaults to the 'odeint' default.
+        max_steps (int): Maximum number of internal steps between two output time
+            points, applied by all backends. With 'solve_ivp', states at time points
+            which are not reached are NaN. Defaults to 500.
+        stiff_method (str): Method used in 'auto' mode for stiff systems.
+            Defaults to 'BDF'.
+        stiffness_threshold (float): In 'auto' mode, a system is considered stiff
+            if its inactivation rate times the observation window exceeds this
+            value. Defaults to 10.
+        compiler (str): 'numpy' or 'numba'. With 'numba', the right-hand side and
+            its Jacobian are compiled with Numba and cached on disk. Falls back to
+            'numpy' if Numba is not installed. Defaults to 'numpy'.
+    """
+
+    backend: str = "odeint"
+    method: str = "LSODA"
+    rtol: float = 1.49012e-8
+    atol: float = 1.49012e-8
+    max_steps: int = 500
+    stiff_method: str = "BDF"
+    stiffness_threshold: float = 10.0
+    compiler: str = "numpy"
+
+    def __post_init__(self):
+        if self.backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown solver backend '{self.backend}'. Use one of {BACKENDS}."
+            )
+        if self.method not in METHODS:
+            raise ValueError(
+                f"Unknown integration method '{self.method}'. Use one of {METHODS}."
+            )
+        if self.stiff_method not in STIFF_METHODS:
+            raise ValueError(
+                f"Unknown stiff method '{self.stiff_method}'. Use one of"
+                f" {STIFF_METHODS}."
+            )
+        if self.compiler not in COMPILERS:
+            raise ValueError(
+                f"Unknown compiler '{self.compiler}'. Use one of {COMPILERS}."
+            )
+        if self.max_steps < 1:
+            raise ValueError("The maximum number of steps has to be positive.")
+
+    def resolve(self, stiffness: float) -> "SolverSettings":
+        """Returns the settings of a concrete backend for a system of given
+        stiffness, which only affects the 'auto' mode."""
+        if self.backend != "auto":
+            return self
+
+        if stiffness > self.stiffness_threshold:
+            return replace(self, backend="solve_ivp", method=self.stiff_method)
+
+        return replace(self, backend="odeint")
+
+
+def integrate(
+    settings: SolverSettings,
+    func: Callable,
+    y0: np.ndarray,
+    time: np.ndarray,
+    params: np.ndarray,
+    jacobian: Optional[Callable] = None,
+    bandwidth: Optional[int] = None,
+) -> np.ndarray:
+    """Integrates 'func(y, t, params)' from 'y0' and returns the states at 'time'.
+
+    Args:
+        settings (SolverSettings): Concrete solver settings.
+        func (Callable): Right-hand side with 'odeint' calling convention.
+        y0 (np.ndarray): Initial states.
+        time (np.ndarray): Output time points.
+        params (np.ndarray): Parameter vector passed to 'func' and 'jacobian'.
+        jacobian (Callable, optional): Jacobian of 'func' in banded storage.
+            Defaults to None.
+        bandwidth (int, optional): Number of sub- and super-diagonals of the
+            Jacobian. Defaults to None.
+
+    Returns:
+        np.ndarray: States of shape (time points, states).
+    """
+    if settings.backend == "odeint":
+        return odeint(
+            func=func,
+            y0=y0,
+            t=time,
+            args=(params,),
+            Dfun=jacobian,
+            ml=bandwidth,
+            mu=bandwidth,
+            rtol=settings.rtol,
+            atol=settings.atol,
+            mxstep=settings.max_steps,
+        )
+
+    kwargs = {}
+    if settings.method == "LSODA" and bandwidth is not None:
+        kwargs = dict(lband=bandwidth, uband=bandwidth)
+        if jacobian is not None:
+            kwargs["jac"] = lambda t, y: jacobian(y, t, params)
+
+    elif settings.method in ("BDF", "Radau") and bandwidth is not None:
+        offsets = bandwidth - np.arange(2 * bandwidth + 1)
+        shape = (y0.size, y0.size)
+
+        if jacobian is not None:
+            kwargs["jac"] = lambda t, y: dia_matrix(
+                (jacobian(y, t, params), offsets), shape=shape
+            ).tocsc()
+        else:
+            kwargs["jac_sparsity"] = dia_matrix(
+                (np.ones((offsets.size, y0.size)), offsets), shape=shape
+            )
+
+    return _solve_ivp(settings, lambda t, y: func(y, t, params), y0, time, **kwargs)
+
+
+def _solve_ivp(
+    settings: SolverSettings,
+    fun: Callable,
+    y0: np.ndarray,
+    time: np.ndarray,
+    **kwargs,
+) -> np.ndarray:
+    """Steps a 'solve_ivp' solver through 'time' like 'solve_ivp' with 't_eval',
+    but stops once more than 'max_steps' steps are taken between two output time
+    points. States at time points which are not reached are NaN."""
+    solver = SOLVERS[settings.method](
+        fun, time[0], y0, time[-1], rtol=settings.rtol, atol=settings.atol, **kwargs
+    )
+
+    states = np.full((time.size, y0.size), np.nan)
+    states[0] = y0
+    reached, steps = 1, 0
+
+    while reached < time.size:
+        message = solver.step()
+        steps += 1
+
+        if solver.status == "failed" or steps > settings.max_steps:
+            warnings.warn(
+                f"Integration with '{settings.method}' failed at t={solver.t}:"
+                f" {message or f'more than {settings.max_steps} steps needed'}.",
+                RuntimeWarning,
+            )
+            break
+
+        passed = np.searchsorted(time, solver.t, side="right")
+        if passed > reached:
+            states[reached:passed] = solver.dense_output()(time[reached:passed]).T
+            reached, steps = passed, 0
+
+    return states
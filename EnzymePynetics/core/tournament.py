@@ -0,0 +1,46 @@
+import math
+
+from dataclasses import dataclass
+
+
+@dataclass
+class TournamentSettings:
+    """Settings of a successive-halving tournament between reaction systems.
+
+    Every system is first fitted with a small budget of function evaluations.
+    The systems are then ranked by the AIC of their best point so far, the bottom
+    fraction is pruned and the survivors continue with a grown budget. Once no
+    more than `n_survivors` systems are left, they are fitted to convergence.
+
+    Attributes:
+        initial_budget (int): Function evaluations per system in the first round.
+            Defaults to 20.
+        growth (float): Factor by which the budget grows from round to round.
+            Defaults to 2.
+        prune_fraction (float): Fraction of the systems pruned per round.
+            Defaults to 0.5.
+        n_survivors (int): Number of systems which are fitted to convergence.
+            Defaults to 1.
+    """
+
+    initial_budget: int = 20
+    growth: float = 2.0
+    prune_fraction: float = 0.5
+    n_survivors: int = 1
+
+    def __post_init__(self):
+        if self.initial_budget < 1:
+            raise ValueError("The initial budget must be at least one evaluation.")
+        if self.growth < 1:
+            raise ValueError("The budget growth must be at least 1.")
+        if not 0 < self.prune_fraction < 1:
+            raise ValueError("The prune fraction must be between 0 and 1.")
+        if self.n_survivors < 1:
+            raise ValueError("At least one system has to survive.")
+
+    def n_kept(self, n_systems: int) -> int:
+        """Number of systems surviving a round of 'n_systems' systems. At least
+        one system is pruned per round."""
+        n_kept = math.ceil(n_systems * (1 - self.prune_fraction))
+
+        return max(self.n_survivors, min(n_systems - 1, n_kept))
@@ -0,0 +1,65 @@
+import json
+import os
+
+import pytest
+
+from EnzymePynetics.core import Estimator, Measurement, Protein, Reactant
+
+EXAMPLE = os.path.join(
+    os.path.dirname(__file__),
+    os.pardir,
+    "EnzymePynetics",
+    "example",
+    "simulated_enzymeML.json",
+)
+
+
+@pytest.fixture
+def estimator() -> Estimator:
+    with open(EXAMPLE) as file:
+        document = json.load(file)
+
+    species = [Reactant(**reactant) for reactant in document["reactants"]]
+    species += [Protein(**protein) for protein in document["proteins"]]
+    estimator = Estimator(
+        name=document["name"],
+        measured_reactant=species[0],
+        measurements=[Measurement(**entry) for entry in document["measurements"]],
+        species=species,
+    )
+
+    substrate, product = estimator.reactants
+    estimator.add_reaction(
+        id="r1",
+        name="Oxidation",
+        educt=substrate,
+        product=product,
+        catalyst=estimator.enzymes[0],
+    )
+    estimator.add_model(
+        id="model1",
+        name="michaelis-menten",
+        equation="substrate = -substrate * catalyst * k_cat / (K_M + substrate)",
+    )
+
+    return estimator
+
+
+@pytest.fixture
+def systems(estimator) -> dict:
+    """Reaction systems of the estimator by name, with and without enzyme
+    inactivation."""
+    estimator.add_model(
+        id="model2",
+        name="enzyme inactivation",
+        equation="catalyst = -k_ie * catalyst",
+    )
+    estimator._create_model_combinations()
+
+    return {system.name: system for system in estimator.reaction_systems}
+
+
+@pytest.fixture
+def fit_args(estimator, systems) -> tuple:
+    """Times, initial conditions and substrate data as passed to 'residuals'."""
+    return systems["michaelis-menten"]._fit_args(*estimator._remove_nans())
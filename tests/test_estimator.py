@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+
+def test_missing_point_at_start_of_time_range(estimator):
+    replicate = estimator.measurements[1].species[0].replicates[0]
+    window_start = np.argmax(replicate.time > 5)
+    replicate.data[window_start] = np.nan
+    estimator.invalidate_data()
+
+    substrate, enzyme, product, time = estimator._subset_time(
+        5, None, *estimator._remove_nans()
+    )
+
+    assert not np.isnan(substrate[:, 0]).any()
+    assert time[1, 0] == replicate.time[window_start + 1]
+
+    estimator.fit_models(min_time=5)
+
+    for system in estimator.reaction_systems:
+        assert system.result.fit_success
+        assert np.isfinite(system.result.AIC)
+
+
+def test_time_range_without_data(estimator):
+    with pytest.raises(ValueError):
+        estimator.fit_models(min_time=1000)
+
+
+def test_replicates_edited_after_fit_are_read_fresh(estimator):
+    estimator.fit_models()
+    data = estimator.measurements[0].species[0]
+    replicate = data.replicates[0]
+    n_replicates = estimator.substrate_data.shape[0]
+    assert data.species_id == estimator.substrate.id
+
+    replicate.data = replicate.data * 0.5
+    np.testing.assert_array_equal(estimator.substrate_data[0], replicate.data)
+
+    data.add_to_replicates(
+        species_id=replicate.species_id,
+        measurement_id=replicate.measurement_id,
+        data_unit=replicate.data_unit,
+        time_unit=replicate.time_unit,
+        time=replicate.time,
+        data=replicate.data,
+    )
+    assert estimator.substrate_data.shape[0] == n_replicates + 1
+    assert estimator.time_data.shape[0] == n_replicates + 1
+    assert estimator.enzyme_data.shape[0] == n_replicates + 1
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+import sympy as sp
+
+from EnzymePynetics.core.jaxbackend import JaxModel, jax_available
+
+pytestmark = pytest.mark.skipif(not jax_available(), reason="JAX is not installed")
+
+if jax_available():
+    import jax
+
+    jax.config.update("jax_enable_x64", True)
+
+S, E, P, K_CAT, K_M, K_IE = sp.symbols("substrate catalyst product k_cat K_M k_ie")
+PARAMS = np.array([12.0, 17.0, 0.1])
+
+
+def michaelis_menten_model() -> JaxModel:
+    rate = K_CAT * E * S / (K_M + S)
+    return JaxModel(
+        rate_laws=[-rate, -K_IE * E, rate],
+        species_symbols=[S, E, P],
+        param_symbols=[K_CAT, K_M, K_IE],
+        rtol=1e-8,
+        atol=1e-8,
+        max_steps=5000,
+    )
+
+
+def grid(replicates: int, time_points: int):
+    init_conditions = np.column_stack(
+        [
+            np.linspace(5, 200, replicates),
+            np.full(replicates, 0.5),
+            np.zeros(replicates),
+        ]
+    )
+    return np.linspace(0, 20, time_points), init_conditions
+
+
+def test_sensitivities_match_finite_differences():
+    model = michaelis_menten_model()
+    times, init_conditions = grid(4, 20)
+
+    sensitivities = model.sensitivities(times, init_conditions, PARAMS)
+
+    for index in range(PARAMS.size):
+        step = 1e-6 * PARAMS[index]
+        upper, lower = PARAMS.copy(), PARAMS.copy()
+        upper[index] += step
+        lower[index] -= step
+        expected = (
+            model.simulate(times, init_conditions, upper)
+            - model.simulate(times, init_conditions, lower)
+        ) / (2 * step)
+
+        np.testing.assert_allclose(
+            sensitivities[..., index], expected, rtol=1e-4, atol=1e-6
+        )
+
+
+def test_sensitivities_of_large_grid():
+    # Reverse-mode differentiation through the solver ran out of memory here
+    sensitivities = michaelis_menten_model().sensitivities(*grid(96, 500), PARAMS)
+
+    assert sensitivities.shape == (96, 500, 3, 3)
+    assert np.isfinite(sensitivities).all()
+
+
+def test_double_precision_is_required():
+    jax.config.update("jax_enable_x64", False)
+    try:
+        with pytest.raises(RuntimeError, match="jax_enable_x64"):
+            michaelis_menten_model()
+    finally:
+        jax.config.update("jax_enable_x64", True)
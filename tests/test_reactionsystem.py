@@ -0,0 +1,171 @@
+import numpy as np
+import pytest
+
+from EnzymePynetics.core import MultiStartSettings, SolverSettings, reactionsystem
+
+
+def central_differences(system, params, fit_args) -> np.ndarray:
+    """Finite-difference Jacobian of the residuals of the varied parameters."""
+    columns = []
+    for name, param in params.items():
+        if not param.vary:
+            continue
+
+        step = 1e-6 * max(abs(param.value), 1.0)
+        upper, lower = params.copy(), params.copy()
+        upper[name].value += step
+        lower[name].value -= step
+        columns.append(
+            (system.residuals(upper, *fit_args) - system.residuals(lower, *fit_args))
+            / (2 * step)
+        )
+
+    return np.column_stack(columns)
+
+
+@pytest.mark.parametrize("fixed_params", [[], ["K_M"]])
+def test_residual_jacobian_matches_finite_differences(systems, fit_args, fixed_params):
+    system = systems["michaelis-menten with enzyme inactivation"]
+    for reaction in system.reactions:
+        for param in reaction.model.parameters:
+            param.value = param.initial_value
+    params = system._create_lmfit_params(fixed_params=fixed_params)
+
+    jacobian = system.residual_jacobian(params, *fit_args)
+    expected = central_differences(system, params, fit_args)
+
+    assert jacobian.shape == expected.shape
+    assert expected.shape[1] == len(params) - len(fixed_params)
+    np.testing.assert_allclose(
+        jacobian, expected, rtol=1e-5, atol=1e-6 * np.abs(expected).max()
+    )
+
+
+def initial_params(system):
+    return {
+        param.name: param.initial_value
+        for reaction in system.reactions
+        for param in reaction.model.parameters
+    }
+
+
+def test_closed_form_matches_odeint(systems, fit_args):
+    system = systems["michaelis-menten"]
+    times, init_conditions, _ = fit_args
+    # Blank and background-corrected wells start without or below zero substrate
+    blanks = init_conditions[:2].copy()
+    blanks[:, 0] = [0.0, -0.5]
+    init_conditions = np.vstack([init_conditions, blanks])
+    times = np.vstack([times, times[:2]])
+    params = initial_params(system)
+
+    closed_form = system.simulate(times, init_conditions, params)
+    integrated = system.simulate(
+        times,
+        init_conditions,
+        params,
+        closed_form=False,
+        solver=SolverSettings(rtol=1e-12, atol=1e-12, max_steps=10000),
+    )
+
+    assert system.compiled_model.closed_form
+    assert np.isfinite(closed_form).all()
+    np.testing.assert_allclose(closed_form, integrated, rtol=0, atol=1e-7)
+
+
+def test_fit_survives_exceeded_max_steps(estimator, systems):
+    system = systems["michaelis-menten with enzyme inactivation"]
+    data = estimator._remove_nans()
+    system.fit(*data)
+    expected = system.fitted_params_dict
+
+    # Some trial points need more steps and are rejected by the optimizer
+    limited = SolverSettings(backend="solve_ivp", method="RK45", max_steps=4)
+    with pytest.warns(RuntimeWarning, match="more than 4 steps"):
+        result = system.fit(*data, solver=limited)
+
+    assert result.success
+    assert system.fitted_params_dict == pytest.approx(expected, rel=1e-4)
+
+    # No trial point can be integrated
+    failing = SolverSettings(backend="solve_ivp", method="RK45", max_steps=2)
+    with pytest.warns(RuntimeWarning, match="more than 2 steps"):
+        result = system.fit(*data, solver=failing)
+
+    assert not result.success
+    assert not system.result.fit_success
+
+
+@pytest.mark.parametrize(
+    "name", ["michaelis-menten", "michaelis-menten with enzyme inactivation"]
+)
+def test_simulate_ensemble_matches_simulate(systems, fit_args, name):
+    system = systems[name]
+    times, init_conditions, _ = fit_args
+    names = system.compiled_model.parameters
+    params = initial_params(system)
+    scales = np.array([[1.0], [0.5], [2.0], [1.5]])
+    params_matrix = np.array([params[parameter] for parameter in names]) * scales
+
+    ensemble = system.simulate_ensemble(
+        params_matrix, times, init_conditions, chunk_size=3
+    )
+
+    assert ensemble.shape == (len(scales), *times.shape, 3)
+    for simulated, row in zip(ensemble, params_matrix):
+        expected = system.simulate(times, init_conditions, dict(zip(names, row)))
+        np.testing.assert_allclose(simulated, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_parallel_multistart_with_sensitivities(estimator, systems):
+    system = systems["michaelis-menten"]
+    data = estimator._remove_nans()
+
+    fits = {}
+    for n_jobs in (None, 2):
+        multistart = MultiStartSettings(n_starts=4, n_jobs=n_jobs, seed=0)
+        result = system.fit(*data, jacobian="sensitivity", multistart=multistart)
+        assert result.success
+        fits[n_jobs] = system.fitted_params_dict
+
+    assert system.result.n_converged >= 1
+    assert fits[2] == pytest.approx(fits[None], rel=1e-6)
+
+
+def test_replicates_with_shared_initial_conditions_are_integrated_once(
+    systems, fit_args, monkeypatch
+):
+    system = systems["michaelis-menten with enzyme inactivation"]
+    times, init_conditions, _ = fit_args
+    # Replicates 0 and 1 are pipetted twice, replicate 2 once
+    rows = np.array([0, 1, 0, 2, 1])
+    times, init_conditions = times[rows], init_conditions[rows]
+    params = initial_params(system)
+
+    stacked_sizes = []
+    integrate = reactionsystem.integrate
+
+    def counting_integrate(settings, func, y0, *args, **kwargs):
+        stacked_sizes.append(y0.size)
+        return integrate(settings, func, y0, *args, **kwargs)
+
+    monkeypatch.setattr(reactionsystem, "integrate", counting_integrate)
+    deduplicated = system.simulate(times, init_conditions, params)
+    assert sum(stacked_sizes) == 3 * init_conditions.shape[1]
+
+    separate = system.simulate(times, init_conditions, params, batched=False)
+    np.testing.assert_allclose(deduplicated, separate, rtol=1e-6, atol=1e-8)
+    np.testing.assert_array_equal(deduplicated[0], deduplicated[2])
+    np.testing.assert_array_equal(deduplicated[1], deduplicated[4])
+
+
+@pytest.mark.parametrize("optimizer", ["trf", "dogbox"])
+def test_jacobian_requires_leastsq(estimator, systems, optimizer):
+    system = systems["michaelis-menten"]
+    data = estimator._remove_nans()
+
+    with pytest.raises(ValueError, match="only supported by the 'leastsq'"):
+        system.fit(*data, jacobian="sensitivity", optimizer=optimizer)
+
+    assert system.fit(*data, jacobian="sensitivity").success
+    assert system.fit(*data, optimizer=optimizer).success